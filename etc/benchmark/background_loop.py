@@ -0,0 +1,61 @@
+# -----------------------------------------------------------------------------
+# Copyright [2025] [Krisna Pranav, Neura AI]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import sys
+import time
+import asyncio
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from neura.providers.asyncio import to_sync_generator, enable_background_loop, shutdown_background_loop
+
+async def fake_stream(chunks: int):
+    for idx in range(chunks):
+        await asyncio.sleep(0)
+        yield f"chunk {idx} "
+
+def run(calls: int, chunks: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        for _ in to_sync_generator(fake_stream(chunks)):
+            pass
+    return time.perf_counter() - start
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare the per-call event loop with the shared background loop")
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--chunks", type=int, default=20)
+    args = parser.parse_args()
+
+    enable_background_loop(False)
+    per_call = run(args.calls, args.chunks)
+
+    enable_background_loop(True)
+    run(10, args.chunks)
+    background = run(args.calls, args.chunks)
+    shutdown_background_loop()
+
+    print(f"calls: {args.calls}, chunks per call: {args.chunks}")
+    print(f"per-call loop:   {per_call:.3f}s ({per_call / args.calls * 1000:.3f} ms/call)")
+    print(f"background loop: {background:.3f}s ({background / args.calls * 1000:.3f} ms/call)")
+    print(f"speedup: {per_call / background:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# -----------------------------------------------------------------------------
+# Copyright [2025] [Krisna Pranav, Neura AI]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import sys
+import time
+import json
+import random
+import asyncio
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from neura.requests import events
+from neura.requests.events import iter_events
+
+def build_stream(count: int) -> bytes:
+    return b"".join(
+        b"data: " + json.dumps({"id": idx, "choices": [{"delta": {"content": f"token {idx} "}}]}).encode() + b"\n\n"
+        for idx in range(count)
+    ) + b"data: [DONE]\n\n"
+
+def split_chunks(stream: bytes, max_size: int) -> list[bytes]:
+    chunks, start = [], 0
+    while start < len(stream):
+        size = random.randint(1, max_size)
+        chunks.append(stream[start:start + size])
+        start += size
+    return chunks
+
+async def iter_chunks(chunks: list[bytes]):
+    for chunk in chunks:
+        yield chunk
+
+async def iter_lines(chunks: list[bytes]):
+    pending = b""
+    async for chunk in iter_chunks(chunks):
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line
+    if pending:
+        yield pending
+
+async def parse_lines(chunks: list[bytes]) -> int:
+    count = 0
+    async for line in iter_lines(chunks):
+        line = line.decode().rstrip("\r")
+        if line.startswith("data: "):
+            data = line[6:]
+            if data == "[DONE]":
+                break
+            json.loads(data)
+            count += 1
+    return count
+
+async def parse_events(chunks: list[bytes]) -> int:
+    count = 0
+    async for _ in iter_events(iter_chunks(chunks), decode_json=True):
+        count += 1
+    return count
+
+def measure(parser, chunks: list[bytes], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        count = asyncio.run(parser(chunks))
+        best = min(best, time.perf_counter() - started)
+    return count / best
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare iter_events() with line-by-line SSE parsing")
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--chunk-size", type=int, default=512)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    random.seed(0)
+    chunks = split_chunks(build_stream(args.events), args.chunk_size)
+
+    print(f"events: {args.events}, chunks: {len(chunks)}, max chunk size: {args.chunk_size}")
+    print(f"line by line + json:   {measure(parse_lines, chunks, args.rounds):>10.0f} events/s")
+    if events.has_orjson:
+        print(f"iter_events + orjson:  {measure(parse_events, chunks, args.rounds):>10.0f} events/s")
+    else:
+        print("iter_events + orjson:  not installed")
+    # The pure Python decoder is what a default install without orjson uses
+    events.has_orjson = False
+    print(f"iter_events + json:    {measure(parse_events, chunks, args.rounds):>10.0f} events/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+# -----------------------------------------------------------------------------
+# Copyright [2025] [Krisna Pranav, Neura AI]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import sys
+import time
+import asyncio
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from curl_cffi.const import CurlHttpVersion
+from h2.config import H2Configuration
+from h2.connection import H2Connection
+from h2.events import RequestReceived, ConnectionTerminated, StreamReset
+
+from neura.requests.curl_cffi import StreamSession
+
+H2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+
+class StubServer:
+    def __init__(self, chunks: int, delay: float) -> None:
+        self.chunks = chunks
+        self.delay = delay
+        self.connections = 0
+        self.peak_streams = 0
+
+    def create_protocol(self) -> asyncio.Protocol:
+        self.connections += 1
+        return StubProtocol(self)
+
+class StubProtocol(asyncio.Protocol):
+    def __init__(self, server: StubServer) -> None:
+        self.server = server
+        self.buffer = b""
+        self.h2: H2Connection = None
+        self.http1 = False
+        self.tasks: set[asyncio.Task] = set()
+        self.active = 0
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self.transport = transport
+
+    def connection_lost(self, exc) -> None:
+        for task in self.tasks:
+            task.cancel()
+
+    def data_received(self, data: bytes) -> None:
+        if self.h2 is not None:
+            return self.h2_received(data)
+        self.buffer += data
+        if not self.http1 and len(self.buffer) < len(H2_PREFACE) and H2_PREFACE.startswith(self.buffer):
+            return
+        if self.buffer.startswith(H2_PREFACE):
+            self.h2 = H2Connection(H2Configuration(client_side=False, header_encoding="utf-8"))
+            self.h2.initiate_connection()
+            data, self.buffer = self.buffer, b""
+            return self.h2_received(data)
+        self.http1 = True
+        while b"\r\n\r\n" in self.buffer:
+            _, self.buffer = self.buffer.split(b"\r\n\r\n", 1)
+            self.spawn(self.http1_stream())
+
+    def spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self.tasks.add(task)
+        self.active += 1
+        self.server.peak_streams = max(self.server.peak_streams, self.active)
+        task.add_done_callback(self.finished)
+
+    def finished(self, task: asyncio.Task) -> None:
+        self.tasks.discard(task)
+        self.active -= 1
+
+    def h2_received(self, data: bytes) -> None:
+        for event in self.h2.receive_data(data):
+            if isinstance(event, RequestReceived):
+                self.spawn(self.h2_stream(event.stream_id))
+            elif isinstance(event, ConnectionTerminated):
+                self.transport.close()
+        self.transport.write(self.h2.data_to_send())
+
+    async def h2_stream(self, stream_id: int) -> None:
+        self.h2.send_headers(stream_id, [(":status", "200"), ("content-type", "text/event-stream")])
+        try:
+            for idx in range(self.server.chunks):
+                await asyncio.sleep(self.server.delay)
+                self.h2.send_data(stream_id, f"data: chunk {idx}\n\n".encode())
+                self.transport.write(self.h2.data_to_send())
+            self.h2.end_stream(stream_id)
+        except StreamReset:
+            pass
+        self.transport.write(self.h2.data_to_send())
+
+    async def http1_stream(self) -> None:
+        self.transport.write(b"HTTP/1.1 200 OK\r\ncontent-type: text/event-stream\r\ntransfer-encoding: chunked\r\n\r\n")
+        for idx in range(self.server.chunks):
+            await asyncio.sleep(self.server.delay)
+            chunk = f"data: chunk {idx}\n\n".encode()
+            self.transport.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+        self.transport.write(b"0\r\n\r\n")
+
+async def run(url: str, streams: int, **kwargs) -> tuple[float, float]:
+    first_chunks = []
+
+    async def stream(session: StreamSession) -> None:
+        started = time.perf_counter()
+        first = None
+        async with session.get(url) as response:
+            async for _ in response.iter_lines():
+                if first is None:
+                    first = time.perf_counter() - started
+        first_chunks.append(first)
+
+    started = time.perf_counter()
+    async with StreamSession(timeout=60, **kwargs) as session:
+        await asyncio.gather(*[stream(session) for _ in range(streams)])
+    return time.perf_counter() - started, sum(first_chunks) / len(first_chunks)
+
+async def benchmark(args: argparse.Namespace) -> None:
+    server = StubServer(args.chunks, args.delay)
+    stub = await asyncio.get_running_loop().create_server(server.create_protocol, "127.0.0.1", 0)
+    url = f"http://127.0.0.1:{stub.sockets[0].getsockname()[1]}/stream"
+
+    modes = {
+        "http/1.1": {"http_version": CurlHttpVersion.V1_1, "max_clients": args.streams},
+        "http/2": {"http2": True, "http_version": CurlHttpVersion.V2_PRIOR_KNOWLEDGE, "max_concurrent_streams": args.max_concurrent_streams},
+    }
+
+    print(f"streams: {args.streams}, chunks per stream: {args.chunks}, chunk delay: {args.delay * 1000:.0f} ms")
+    for name, kwargs in modes.items():
+        server.connections = server.peak_streams = 0
+        duration, first_chunk = await run(url, args.streams, **kwargs)
+        print(f"{name:<9} connections: {server.connections:>4}, peak streams per connection: {server.peak_streams:>4}, total: {duration:.3f}s, avg first chunk: {first_chunk * 1000:.1f} ms")
+
+    stub.close()
+    await stub.wait_closed()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare HTTP/1.1 and multiplexed HTTP/2 streaming against a local stub server (requires h2)")
+    parser.add_argument("--streams", type=int, default=200)
+    parser.add_argument("--chunks", type=int, default=20)
+    parser.add_argument("--delay", type=float, default=0.01)
+    parser.add_argument("--max-concurrent-streams", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(benchmark(args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# -----------------------------------------------------------------------------
+# Copyright [2025] [Krisna Pranav, Neura AI]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import sys
+import timeit
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from neura.Provider.Yqcloud import Yqcloud
+
+KWARGS = {"proxy": None, "conversation": None, "temperature": 0.5, "unknown": True}
+
+def reflect() -> dict:
+    names = Yqcloud.build_parameters()
+    Yqcloud.build_parameters(as_json=True)
+    return {key: value for key, value in KWARGS.items() if key in names}
+
+def cached() -> dict:
+    Yqcloud.get_parameters(as_json=True)
+    return Yqcloud.filter_parameters(KWARGS)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare per-request parameter reflection with the cached schema")
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    cached()
+    for name, func in (("reflection", reflect), ("cached", cached)):
+        seconds = timeit.timeit(func, number=args.number)
+        print(f"{name:<12} {seconds / args.number * 1e6:8.2f} us/request")
+
+if __name__ == "__main__":
+    main()
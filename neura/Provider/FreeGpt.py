@@ -14,13 +14,14 @@
 # limitations under the License.
 # -----------------------------------------------------------------------------
 
+from __future__ import annotations
+
 import time
 import hashlib
 import random
-from __future__ import annotations
 from typing import AsyncGenerator, Optional, Dict, Any
 from ..typing import Messages
-from ..requests import StreamSession, raise_for_status
+from ..requests import get_session, raise_for_status
 from .base_provider import AsyncGeneratorProvider, ProviderModelMixin
 from ..errors import RateLimitError
 
@@ -48,20 +49,14 @@ class FreeGpt(AsyncGeneratorProvider, ProviderModelMixin):
         data = cls._build_request_data(messages, prompt, timestamp)
         domain = random.choice(DOMAINS)
 
-        async with StreamSession(
-            impersonate="chrome",
-            timeout=timeout,
-            proxies={"all": proxy} if proxy else None
-        ) as session:
-            async with session.post(f"{domain}/api/generate", json=data) as response:
+        async with get_session(impersonate="chrome", proxy=proxy, url=domain) as session:
+            async with session.post(f"{domain}/api/generate", json=data, timeout=timeout) as response:
                 await raise_for_status(response)
                 
-                async for chunk in response.iter_content():
-                    chunk_decoded = chunk.decode(errors="ignore")
-                    
-                    if chunk_decoded == RATE_LIMIT_ERROR_MESSAGE:
+                async for chunk in response.iter_text():
+                    if chunk == RATE_LIMIT_ERROR_MESSAGE:
                         raise RateLimitError("Rate limit reached")
-                    yield chunk_decoded
+                    yield chunk
 
     @staticmethod
     def _build_request_data(messages: Messages, prompt: str, timestamp: int, secret: str = "") -> Dict[str, Any]:
@@ -14,10 +14,11 @@
 # limitations under the License.
 # -----------------------------------------------------------------------------
 
-import time
 from __future__ import annotations
-from aiohttp import ClientSession
+
+import time
 from ..typing import AsyncResult, Messages
+from ..requests import get_session
 from ..requests.raise_for_status import raise_for_status
 from .base_provider import AsyncGeneratorProvider, ProviderModelMixin
 from .helper import format_prompt
@@ -66,7 +67,7 @@ class Yqcloud(AsyncGeneratorProvider, ProviderModelMixin):
             system_message = current_messages[0]["content"]
             current_messages = current_messages[1:]
 
-        async with ClientSession(headers=headers) as session:
+        async with get_session("aiohttp", headers=headers, url=cls.api_endpoint) as session:
             prompt = format_prompt(current_messages)
 
             data = {
@@ -81,11 +82,9 @@ class Yqcloud(AsyncGeneratorProvider, ProviderModelMixin):
             async with session.post(cls.api_endpoint, json=data, proxy=proxy) as response:
                 await raise_for_status(response)
                 full_message = ""
-                async for chunk in response.content:
-                    if chunk:
-                        message = chunk.decode()
-                        yield message
-                        full_message += message
+                async for message in response.iter_text():
+                    yield message
+                    full_message += message
 
                 if return_conversation:
                     conversation.message_history.append({"role": "assistant", "content": full_message})
@@ -14,10 +14,11 @@
 # limitations under the License.
 # -----------------------------------------------------------------------------
 
+from __future__ import annotations
+
 import os
 import time
 import json
-from __future__ import annotations
 
 try:
     from platformdirs import user_config_dir
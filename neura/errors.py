@@ -57,7 +57,11 @@ class ResponseError(Exception):
     ...
 
 class ResponseStatusError(Exception):
-    ...
+    def __init__(self, *args, status: int = None, retry_after: float = None, classification: str = None) -> None:
+        super().__init__(*args)
+        self.status = status
+        self.retry_after = retry_after
+        self.classification = classification
 
 class RateLimitError(ResponseStatusError):
     ...
@@ -66,6 +70,13 @@ class NoValidHarFileError(Exception):
     ...
     
 class TimeoutError(Exception):
+    ...
 
 class ConversationLimitError(Exception):
-    
\ No newline at end of file
+    ...
+
+class ProviderBusyError(Exception):
+    ...
+
+class ParameterNotSupportedError(Exception):
+    ...
@@ -14,10 +14,11 @@
 # limitations under the License.
 # -----------------------------------------------------------------------------
 
+from __future__ import annotations
+
 import os
 import requests
 import json
-from __future__ import annotations
 from ..requests.raise_for_status import raise_for_status
 
 def load_models():
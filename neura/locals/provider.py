@@ -14,8 +14,9 @@
 # limitations under the License.
 # -----------------------------------------------------------------------------
 
-import os
 from __future__ import annotations
+
+import os
 from gpt4all import GPT4All
 from .models import get_models
 from ..typing import Messages
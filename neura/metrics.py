@@ -0,0 +1,181 @@
+# -----------------------------------------------------------------------------
+# Copyright [2025] [Krisna Pranav, Neura AI]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from typing import Optional, Union
+from urllib.parse import urlparse
+
+LATENCY_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120]
+CHUNK_BUCKETS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500]
+RATE_BUCKETS = [10, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+HISTOGRAM_BUCKETS = {
+    "neura_provider_time_to_first_token_seconds": LATENCY_BUCKETS,
+    "neura_provider_duration_seconds": LATENCY_BUCKETS,
+    "neura_provider_chunks": CHUNK_BUCKETS,
+    "neura_provider_characters_per_second": RATE_BUCKETS,
+    "neura_http_response_time_seconds": LATENCY_BUCKETS,
+}
+
+class MetricsConfig:
+    enabled: bool = False
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: list[float]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def get_dict(self) -> dict:
+        cumulative, buckets = 0, {}
+        for bound, count in zip(self.buckets + ["+Inf"], self.counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        return {"buckets": buckets, "sum": self.sum, "count": self.count}
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self.counters: dict[str, dict[tuple, float]] = {}
+        self.histograms: dict[str, dict[tuple, Histogram]] = {}
+        self.lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        key = tuple(sorted(labels.items()))
+        with self.lock:
+            values = self.counters.setdefault(name, {})
+            values[key] = values.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        key = tuple(sorted(labels.items()))
+        with self.lock:
+            values = self.histograms.setdefault(name, {})
+            if key not in values:
+                values[key] = Histogram(HISTOGRAM_BUCKETS.get(name, LATENCY_BUCKETS))
+            values[key].observe(value)
+
+    def reset(self) -> None:
+        with self.lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def get_dict(self) -> dict:
+        with self.lock:
+            return {
+                "counters": {
+                    name: [{"labels": dict(key), "value": value} for key, value in values.items()]
+                    for name, values in self.counters.items()
+                },
+                "histograms": {
+                    name: [{"labels": dict(key), **histogram.get_dict()} for key, histogram in values.items()]
+                    for name, values in self.histograms.items()
+                },
+            }
+
+    def export_prometheus(self) -> str:
+        lines = []
+
+        with self.lock:
+            for name, values in self.counters.items():
+                lines.append(f"# TYPE {name} counter")
+                for key, value in values.items():
+                    lines.append(f"{name}{format_labels(key)} {format_value(value)}")
+            for name, values in self.histograms.items():
+                lines.append(f"# TYPE {name} histogram")
+                for key, histogram in values.items():
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets + ["+Inf"], histogram.counts):
+                        cumulative += count
+                        lines.append(f"{name}_bucket{format_labels(key + (('le', str(bound)),))} {cumulative}")
+                    lines.append(f"{name}_sum{format_labels(key)} {format_value(histogram.sum)}")
+                    lines.append(f"{name}_count{format_labels(key)} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+def format_labels(labels: tuple) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(
+        f'{key}="' + str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        for key, value in labels
+    ) + "}"
+
+def format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+registry = MetricsRegistry()
+
+def enable_metrics(enabled: bool = True) -> None:
+    MetricsConfig.enabled = enabled
+
+def is_enabled() -> bool:
+    return MetricsConfig.enabled
+
+def inc(name: str, value: float = 1, **labels) -> None:
+    if MetricsConfig.enabled:
+        registry.inc(name, value, **labels)
+
+def observe(name: str, value: float, **labels) -> None:
+    if MetricsConfig.enabled:
+        registry.observe(name, value, **labels)
+
+def record_call(layer: str, provider: str, model: Optional[str], stats, error: Union[Exception, str] = None, failover: bool = False) -> None:
+    if not MetricsConfig.enabled:
+        return
+
+    labels = {"layer": layer, "provider": provider, "model": model or ""}
+    registry.inc("neura_provider_requests_total", **labels)
+
+    if error is not None:
+        registry.inc("neura_provider_errors_total", error=error if isinstance(error, str) else error.__class__.__name__, **labels)
+    if failover:
+        registry.inc("neura_provider_failovers_total", **labels)
+    if stats.time_to_first_token is not None:
+        registry.observe("neura_provider_time_to_first_token_seconds", stats.time_to_first_token, **labels)
+
+    duration = stats.duration
+    registry.observe("neura_provider_duration_seconds", duration, **labels)
+    registry.observe("neura_provider_chunks", stats.chunks, **labels)
+
+    if stats.characters and duration > 0:
+        registry.observe("neura_provider_characters_per_second", stats.characters / duration, **labels)
+
+def record_http(backend: str, method: str, url: str, status: Union[int, Exception], duration: float) -> None:
+    if not MetricsConfig.enabled:
+        return
+
+    labels = {"backend": backend, "method": method.upper(), "host": urlparse(url).netloc}
+    registry.inc("neura_http_requests_total", status=status.__class__.__name__ if isinstance(status, Exception) else str(status), **labels)
+    registry.observe("neura_http_response_time_seconds", duration, **labels)
+
+def export_prometheus() -> str:
+    return registry.export_prometheus()
+
+def get_metrics() -> dict:
+    return registry.get_dict()
+
+def reset_metrics() -> None:
+    registry.reset()
@@ -14,10 +14,14 @@
 # limitations under the License.
 # -----------------------------------------------------------------------------
 
+from __future__ import annotations
+
+import atexit
 import asyncio
+import threading
+from queue import Queue
 from asyncio import AbstractEventLoop, runners
-from typing import Optional, Callable, AsyncIterator, Iterator
-from __future__ import annotations
+from typing import Optional, Callable, AsyncIterator, Iterator, Coroutine, Any
 from ..errors import NestAsyncioError
 
 try:
@@ -31,6 +35,13 @@ try:
 except ImportError:
     has_uvloop = False
 
+class BackgroundLoop:
+    enabled: bool = False
+    use_nest_asyncio: bool = True
+    loop: Optional[AbstractEventLoop] = None
+    thread: Optional[threading.Thread] = None
+    lock: threading.Lock = threading.Lock()
+
 def get_running_loop(check_nested: bool) -> Optional[AbstractEventLoop]:
     try:
         loop = asyncio.get_running_loop()
@@ -40,15 +51,34 @@ def get_running_loop(check_nested: bool) -> Optional[AbstractEventLoop]:
                return loop
            
         if not hasattr(loop.__class__, "_nest_patched"):
-            if has_nest_asyncio:
+            if has_nest_asyncio and BackgroundLoop.use_nest_asyncio:
                 nest_asyncio.apply(loop)
-            elif check_nested:
+            elif check_nested and BackgroundLoop.use_nest_asyncio:
                 raise NestAsyncioError('Install "nest_asyncio" package | pip install -U nest_asyncio')
         return loop
     
     except RuntimeError:
         pass
 
+def has_running_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+def is_nest_patched(loop: AbstractEventLoop) -> bool:
+    return hasattr(loop.__class__, "_nest_patched")
+
+def needs_worker_loop(loop: Optional[AbstractEventLoop]) -> bool:
+    return BackgroundLoop.enabled or (loop is not None and not is_nest_patched(loop))
+
+def run_sync(coro: Coroutine) -> Any:
+    if needs_worker_loop(get_running_loop(check_nested=False)):
+        return run_in_worker_loop(coro)
+
+    return asyncio.run(coro)
+
 async def await_callback(callback: Callable):
     return await callback()
 
@@ -56,11 +86,19 @@ async def async_generator_to_list(generator: AsyncIterator) -> list:
     return [item async for item in generator]
 
 def to_sync_generator(generator: AsyncIterator, stream: bool = True) -> Iterator:
+    loop = get_running_loop(check_nested=False)
+
+    if needs_worker_loop(loop):
+        if stream:
+            yield from iter_in_worker_loop(generator)
+        else:
+            yield from run_in_worker_loop(async_generator_to_list(generator))
+        return
+
     if not stream:
         yield from asyncio.run(async_generator_to_list(generator))
         return
 
-    loop = get_running_loop(check_nested=False)
     new_loop = False
     
     if loop is None:
@@ -91,4 +129,133 @@ async def to_async_iterator(iterator: Iterator) -> AsyncIterator:
         async for item in iterator:
             yield item
     except TypeError:
-        yield await iterator
\ No newline at end of file
+        yield await iterator
+
+def enable_background_loop(enabled: bool = True) -> None:
+    BackgroundLoop.enabled = enabled
+
+    if not enabled:
+        shutdown_background_loop()
+
+def enable_nest_asyncio(enabled: bool = True) -> None:
+    BackgroundLoop.use_nest_asyncio = enabled
+
+def is_background_thread() -> bool:
+    return BackgroundLoop.thread is threading.current_thread()
+
+def get_background_loop() -> AbstractEventLoop:
+    with BackgroundLoop.lock:
+        if BackgroundLoop.loop is None or BackgroundLoop.loop.is_closed():
+            BackgroundLoop.loop, BackgroundLoop.thread = start_loop_thread("neura-event-loop")
+
+        return BackgroundLoop.loop
+
+def start_loop_thread(name: str) -> tuple[AbstractEventLoop, threading.Thread]:
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=_run_loop_forever, args=(loop,), name=name, daemon=True)
+    thread.start()
+    return loop, thread
+
+def stop_loop_thread(loop: AbstractEventLoop, thread: threading.Thread, timeout: float = None) -> None:
+    try:
+        # Async generators clean up on their own loop, the session pool closes its sessions this way
+        asyncio.run_coroutine_threadsafe(loop.shutdown_asyncgens(), loop).result(timeout)
+    except Exception:
+        pass
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout)
+
+    if not thread.is_alive():
+        loop.close()
+
+def _run_loop_forever(loop: AbstractEventLoop) -> None:
+    asyncio.set_event_loop(loop)
+    loop.run_forever()
+
+def run_in_worker_loop(coro: Coroutine) -> Any:
+    if not is_background_thread():
+        return run_in_background_loop(coro)
+
+    loop, thread = start_loop_thread("neura-worker-loop")
+
+    try:
+        return run_in_background_loop(coro, loop=loop)
+    finally:
+        stop_loop_thread(loop, thread)
+
+def iter_in_worker_loop(generator: AsyncIterator) -> Iterator:
+    if not is_background_thread():
+        yield from iter_in_background_loop(generator)
+        return
+
+    loop, thread = start_loop_thread("neura-worker-loop")
+
+    try:
+        yield from iter_in_background_loop(generator, loop=loop)
+    finally:
+        stop_loop_thread(loop, thread)
+
+def run_in_background_loop(coro: Coroutine, timeout: float = None, loop: AbstractEventLoop = None) -> Any:
+    future = asyncio.run_coroutine_threadsafe(coro, get_background_loop() if loop is None else loop)
+
+    try:
+        return future.result(timeout)
+    finally:
+        future.cancel()
+
+def iter_in_background_loop(generator: AsyncIterator, loop: AbstractEventLoop = None) -> Iterator:
+    queue = Queue()
+
+    async def produce() -> None:
+        try:
+            async for chunk in generator:
+                queue.put((False, chunk))
+        except BaseException as e:
+            queue.put((True, e))
+            raise
+        else:
+            queue.put((True, None))
+        finally:
+            if hasattr(generator, "aclose"):
+                await generator.aclose()
+
+    future = asyncio.run_coroutine_threadsafe(produce(), get_background_loop() if loop is None else loop)
+
+    try:
+        while True:
+            done, value = queue.get()
+            if done:
+                if value is not None:
+                    raise value
+                return
+            yield value
+    finally:
+        future.cancel()
+
+def shutdown_background_loop(timeout: float = 5) -> None:
+    with BackgroundLoop.lock:
+        loop, thread = BackgroundLoop.loop, BackgroundLoop.thread
+        BackgroundLoop.loop = None
+        BackgroundLoop.thread = None
+
+    if loop is None or loop.is_closed():
+        return
+
+    if thread is threading.current_thread():
+        raise RuntimeError("Background loop can not be shut down from its own thread")
+
+    async def shutdown() -> None:
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await loop.shutdown_asyncgens()
+        if hasattr(loop, "shutdown_default_executor"):
+            await loop.shutdown_default_executor()
+
+    try:
+        asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout)
+    finally:
+        stop_loop_thread(loop, thread, timeout)
+
+atexit.register(shutdown_background_loop)
@@ -0,0 +1,111 @@
+# -----------------------------------------------------------------------------
+# Copyright [2025] [Krisna Pranav, Neura AI]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import os
+import copy
+import json
+import asyncio
+import threading
+from pathlib import Path
+from concurrent.futures import Future
+from typing import Optional
+
+class AuthCache:
+    entries: dict[str, tuple[int, dict]] = {}
+    pending: dict[str, Future] = {}
+    lock: threading.Lock = threading.Lock()
+
+def read_auth(cache_file: Path) -> Optional[dict]:
+    path = str(cache_file)
+
+    try:
+        mtime = cache_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        with AuthCache.lock:
+            AuthCache.entries.pop(path, None)
+        return None
+
+    with AuthCache.lock:
+        entry = AuthCache.entries.get(path)
+        if entry is not None and entry[0] == mtime:
+            return copy.deepcopy(entry[1])
+
+    try:
+        with cache_file.open("r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    with AuthCache.lock:
+        AuthCache.entries[path] = (mtime, copy.deepcopy(data))
+
+    return data
+
+def write_auth(cache_file: Path, data: dict) -> None:
+    path = str(cache_file)
+
+    with AuthCache.lock:
+        entry = AuthCache.entries.get(path)
+        if entry is not None and entry[1] == data and cache_file.exists():
+            return
+
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_file.write_text(json.dumps(data))
+    os.replace(tmp_file, cache_file)
+
+    with AuthCache.lock:
+        AuthCache.entries[path] = (cache_file.stat().st_mtime_ns, copy.deepcopy(data))
+
+def delete_auth(cache_file: Path) -> None:
+    with AuthCache.lock:
+        AuthCache.entries.pop(str(cache_file), None)
+
+    cache_file.unlink(missing_ok=True)
+
+def begin_auth(cache_file: Path) -> tuple[Future, bool]:
+    with AuthCache.lock:
+        future = AuthCache.pending.get(str(cache_file))
+        if future is not None:
+            return future, False
+        future = Future()
+        AuthCache.pending[str(cache_file)] = future
+        return future, True
+
+def wait_auth(future: Future) -> Optional[dict]:
+    data = future.result()
+    return None if data is None else copy.deepcopy(data)
+
+async def wait_auth_async(future: Future) -> Optional[dict]:
+    data = await asyncio.wrap_future(future)
+    return None if data is None else copy.deepcopy(data)
+
+def end_auth(cache_file: Path, future: Future, data: dict = None, error: BaseException = None) -> None:
+    # A result of None tells the waiting callers that the auth was interrupted and should be retried
+    with AuthCache.lock:
+        if AuthCache.pending.get(str(cache_file)) is future:
+            del AuthCache.pending[str(cache_file)]
+
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(data)
+
+def clear_auth_cache() -> None:
+    with AuthCache.lock:
+        AuthCache.entries.clear()
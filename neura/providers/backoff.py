@@ -0,0 +1,64 @@
+# -----------------------------------------------------------------------------
+# Copyright [2025] [Krisna Pranav, Neura AI]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import time
+import random
+from typing import Optional
+
+from ..errors import (
+    MissingAuthError, ModelNotSupportedError, ModelNotFoundError, ModelNotAllowedError,
+    MissingRequirementsError, ParameterNotSupportedError, ResponseStatusError, RateLimitError
+)
+
+FATAL_ERRORS = (
+    MissingAuthError, ModelNotSupportedError, ModelNotFoundError, ModelNotAllowedError,
+    MissingRequirementsError, ParameterNotSupportedError,
+)
+
+RETRYABLE_STATUS = [408, 409, 425, 429, 500, 502, 503, 504, 520, 521, 522, 523, 524]
+
+class RetryPolicy:
+    def __init__(self, base_delay: float = 0.5, max_delay: float = 30.0, multiplier: float = 2.0, jitter: bool = True, deadline: Optional[float] = None) -> None:
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.deadline = deadline
+
+    def is_retryable(self, error: Exception) -> bool:
+        if isinstance(error, FATAL_ERRORS):
+            return False
+        if isinstance(error, RateLimitError):
+            return True
+        if isinstance(error, ResponseStatusError) and error.status is not None:
+            return error.status in RETRYABLE_STATUS
+        return True
+
+    def get_delay(self, attempt: int, error: Exception = None) -> float:
+        retry_after = getattr(error, "retry_after", None)
+
+        if retry_after is not None:
+            return max(0.0, retry_after)
+
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** attempt)
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def get_remaining(self, started_at: float) -> Optional[float]:
+        if self.deadline is None:
+            return None
+        return self.deadline - (time.monotonic() - started_at)
@@ -14,13 +14,14 @@
 # limitations under the License.
 # -----------------------------------------------------------------------------
 
+from __future__ import annotations
+
 import asyncio
 import json
-from __future__ import annotations
 from asyncio import AbstractEventLoop
 from concurrent.futures import ThreadPoolExecutor
 from abc import abstractmethod
-from inspect import signature, Parameter
+from inspect import signature, Parameter, isgeneratorfunction
 from typing import Optional, _GenericAlias
 from pathlib import Path
 
@@ -29,14 +30,18 @@ try:
 except ImportError:
     NoneType = type(None)
 
-from ..typing import CreateResult, AsyncResult, Messages
+from ..typing import CreateResult, AsyncResult, Messages, AsyncIterator, Iterator
 from .types import BaseProvider
-from .asyncio import get_running_loop, to_sync_generator, to_async_iterator
+from .asyncio import run_sync, to_sync_generator, to_async_iterator, has_running_loop
 from .response import BaseConversation, AuthResult
-from .helper import concat_chunks, async_concat_chunks
+from .helper import concat_chunks, async_concat_chunks, coalesce_chunks
+from .executor import get_executor
+from .auth_cache import read_auth, write_auth, delete_auth, begin_auth, end_auth, wait_auth, wait_auth_async
+from .batch import BatchResponse, BatchResult, BatchStats, create_batch, iter_batch
+from .scoring import iter_with_metrics
 from ..cookies import get_cookies_dir
-from ..errors import ModelNotSupportedError, ResponseError, MissingAuthError, NoValidHarFileError
-from .. import debug
+from ..errors import ModelNotSupportedError, ResponseError, MissingAuthError, NoValidHarFileError, ParameterNotSupportedError
+from .. import debug, metrics, tracing
 
 SAFE_PARAMETERS = [
     "model", "messages", "stream", "timeout",
@@ -81,7 +86,57 @@ PARAMETER_EXAMPLES = {
     "tools": [],
 }
 
+class ParameterCache:
+    parameters: dict[type, dict[str, Parameter]] = {}
+    json: dict[type, dict] = {}
+    names: dict[type, frozenset[str]] = {}
+    params: dict[type, str] = {}
+
+def clear_parameters_cache() -> None:
+    ParameterCache.parameters.clear()
+    ParameterCache.json.clear()
+    ParameterCache.names.clear()
+    ParameterCache.params.clear()
+
+def get_type_as_var(cls: type, annotation: type, key: str, default):
+    if key in PARAMETER_EXAMPLES:
+        if key == "messages" and not cls.supports_system_message:
+            return [PARAMETER_EXAMPLES[key][-1]]
+        return PARAMETER_EXAMPLES[key]
+    
+    if isinstance(annotation, type):
+        if issubclass(annotation, int):
+            return 0
+        elif issubclass(annotation, float):
+            return 0.0
+        elif issubclass(annotation, bool):
+            return False
+        elif issubclass(annotation, str):
+            return ""
+        elif issubclass(annotation, dict):
+            return {}
+        elif issubclass(annotation, list):
+            return []
+        elif issubclass(annotation, BaseConversation):
+            return {}
+        elif issubclass(annotation, NoneType):
+            return {}
+    elif annotation is None:
+        return None
+    elif annotation == "str" or annotation == "list[str]":
+        return default
+    elif isinstance(annotation, _GenericAlias):
+        if annotation.__origin__ is Optional:
+            return get_type_as_var(cls, annotation.__args__[0], key, default)
+    else:
+        return str(annotation)
+
 class AbstractProvider(BaseProvider):
+    # Set max_workers to run create_async on a bounded executor of its own instead of the loop's default one
+    max_workers: Optional[int] = None
+    max_queue_size: Optional[int] = None
+    block_when_busy: bool = True
+
     @classmethod
     @abstractmethod
     def create_completion(cls, model: str, messages: Messages, stream: bool, **kwargs) -> CreateResult:
@@ -89,16 +144,29 @@ class AbstractProvider(BaseProvider):
 
     @classmethod
     async def create_async(cls, model: str, messages: Messages, *, timeout: int = None, loop: AbstractEventLoop = None, executor: ThreadPoolExecutor = None, **kwargs) -> str:
-        loop = asyncio.get_running_loop() if loop is None else loop
-
         def create_func() -> str:
             return concat_chunks(cls.create_completion(model, messages, **kwargs))
 
+        provider_executor = get_executor(cls) if executor is None and loop is None else None
+
+        if provider_executor is not None:
+            return await asyncio.wait_for(provider_executor.run(create_func), timeout=timeout)
+
+        loop = asyncio.get_running_loop() if loop is None else loop
+
         return await asyncio.wait_for(
             loop.run_in_executor(executor, create_func),
             timeout=timeout
         )
 
+    @classmethod
+    async def create_batch(cls, model: str, messages_list: list[Messages], concurrency: int = 5, **kwargs) -> BatchResponse:
+        return await create_batch(cls.get_async_create_function(), model, messages_list, concurrency, **kwargs)
+
+    @classmethod
+    def iter_batch(cls, model: str, messages_list: list[Messages], concurrency: int = 5, stats: BatchStats = None, **kwargs) -> AsyncIterator[BatchResult]:
+        return iter_batch(cls.get_async_create_function(), model, messages_list, concurrency, stats, **kwargs)
+
     @classmethod
     def get_create_function(cls) -> callable:
         return cls.create_completion
@@ -109,6 +177,15 @@ class AbstractProvider(BaseProvider):
 
     @classmethod
     def get_parameters(cls, as_json: bool = False) -> dict[str, Parameter]:
+        cache = ParameterCache.json if as_json else ParameterCache.parameters
+
+        if cls not in cache:
+            cache[cls] = cls.build_parameters(as_json)
+
+        return dict(cache[cls])
+
+    @classmethod
+    def build_parameters(cls, as_json: bool = False) -> dict[str, Parameter]:
         params = {name: parameter for name, parameter in signature(
             cls.create_async_generator if issubclass(cls, AsyncGeneratorProvider) else
             cls.create_async if issubclass(cls, AsyncProvider) else
@@ -117,42 +194,10 @@ class AbstractProvider(BaseProvider):
             and (name != "stream" or cls.supports_stream)}
         
         if as_json:
-            def get_type_as_var(annotation: type, key: str, default):
-                if key in PARAMETER_EXAMPLES:
-                    if key == "messages" and not cls.supports_system_message:
-                        return [PARAMETER_EXAMPLES[key][-1]]
-                    return PARAMETER_EXAMPLES[key]
-                
-                if isinstance(annotation, type):
-                    if issubclass(annotation, int):
-                        return 0
-                    elif issubclass(annotation, float):
-                        return 0.0
-                    elif issubclass(annotation, bool):
-                        return False
-                    elif issubclass(annotation, str):
-                        return ""
-                    elif issubclass(annotation, dict):
-                        return {}
-                    elif issubclass(annotation, list):
-                        return []
-                    elif issubclass(annotation, BaseConversation):
-                        return {}
-                    elif issubclass(annotation, NoneType):
-                        return {}
-                elif annotation is None:
-                    return None
-                elif annotation == "str" or annotation == "list[str]":
-                    return default
-                elif isinstance(annotation, _GenericAlias):
-                    if annotation.__origin__ is Optional:
-                        return get_type_as_var(annotation.__args__[0])
-                else:
-                    return str(annotation)
             return { name: (
                 param.default
                 if isinstance(param, Parameter) and param.default is not Parameter.empty and param.default is not None
-                else get_type_as_var(param.annotation, name, param.default) if isinstance(param, Parameter) else param
+                else get_type_as_var(cls, param.annotation, name, param.default) if isinstance(param, Parameter) else param
             ) for name, param in {
                 **BASIC_PARAMETERS,
                 **params,
@@ -160,9 +205,31 @@ class AbstractProvider(BaseProvider):
             }.items()}
         return params
 
+    @classmethod
+    def get_parameter_names(cls) -> frozenset[str]:
+        if cls not in ParameterCache.names:
+            ParameterCache.names[cls] = frozenset(cls.get_parameters())
+
+        return ParameterCache.names[cls]
+
+    @classmethod
+    def filter_parameters(cls, kwargs: dict, strict: bool = False) -> dict:
+        names = cls.get_parameter_names()
+
+        if strict:
+            unsupported = [key for key in kwargs if key not in names]
+            if unsupported:
+                raise ParameterNotSupportedError(f"Parameters not supported by {cls.__name__}: {', '.join(unsupported)}")
+            return dict(kwargs)
+
+        return {key: value for key, value in kwargs.items() if key in names}
+
     @classmethod
     @property
     def params(cls) -> str:
+        if cls in ParameterCache.params:
+            return ParameterCache.params[cls]
+
         def get_type_name(annotation: type) -> str:
             return getattr(annotation, "__name__", str(annotation)) if annotation is not Parameter.empty else ""
 
@@ -176,13 +243,13 @@ class AbstractProvider(BaseProvider):
             args += f" = {default_value}" if param.default is not Parameter.empty else ""
             args += ","
 
-        return f"neura.Provider.{cls.__name__} supports: ({args}\n)"
+        ParameterCache.params[cls] = f"neura.Provider.{cls.__name__} supports: ({args}\n)"
+        return ParameterCache.params[cls]
 
 class AsyncProvider(AbstractProvider):
     @classmethod
     def create_completion(cls, model: str, messages: Messages, stream: bool = False, **kwargs) -> CreateResult:
-        get_running_loop(check_nested=False)
-        yield asyncio.run(cls.create_async(model, messages, **kwargs))
+        yield run_sync(cls.create_async(model, messages, **kwargs))
 
     @staticmethod
     @abstractmethod
@@ -199,26 +266,39 @@ class AsyncProvider(AbstractProvider):
 
 class AsyncGeneratorProvider(AbstractProvider):
     supports_stream = True
+    coalesce_size: Optional[int] = None
+    coalesce_latency: Optional[float] = 0.05
 
     @classmethod
     def create_completion(cls, model: str, messages: Messages, stream: bool = True, **kwargs ) -> CreateResult:
-        return to_sync_generator(
-            cls.create_async_generator(model, messages, stream=stream, **kwargs),
+        response = to_sync_generator(
+            cls.get_async_create_function()(model, messages, stream=stream, **kwargs),
             stream=stream
         )
+        if metrics.is_enabled():
+            return iter_with_metrics(cls.__name__, model, response)
+        return response
 
     @staticmethod
     @abstractmethod
     async def create_async_generator(model: str, messages: Messages, stream: bool = True, **kwargs) -> AsyncResult:
         raise NotImplementedError()
 
+    @classmethod
+    def create_coalesced_generator(cls, model: str, messages: Messages, stream: bool = True, **kwargs) -> AsyncResult:
+        return coalesce_chunks(
+            cls.create_async_generator(model, messages, stream=stream, **kwargs),
+            max_size=cls.coalesce_size,
+            max_latency=cls.coalesce_latency
+        )
+
     @classmethod
     def get_create_function(cls) -> callable:
         return cls.create_completion
 
     @classmethod
     def get_async_create_function(cls) -> callable:
-        return cls.create_async_generator
+        return cls.create_coalesced_generator if cls.coalesce_size else cls.create_async_generator
 
 class ProviderModelMixin:
     default_model: str = None
@@ -279,7 +359,7 @@ class AsyncAuthedProvider(AsyncGeneratorProvider):
         if hasattr(auth_result, "__aiter__"):
             return to_sync_generator(auth_result)
         
-        return asyncio.run(auth_result)
+        return run_sync(auth_result)
 
     @classmethod
     def get_create_function(cls) -> callable:
@@ -294,62 +374,136 @@ class AsyncAuthedProvider(AsyncGeneratorProvider):
         return Path(get_cookies_dir()) / f"auth_{cls.parent if hasattr(cls, 'parent') else cls.__name__}.json"
 
     @classmethod
-    def create_completion(cls, model: str, messages: Messages, **kwargs) -> CreateResult:
-        auth_result = AuthResult()
+    def iter_auth(cls, refresh_from: dict = None, **kwargs) -> Iterator:
         cache_file = cls.get_cache_file()
-        
+
+        while True:
+            data = read_auth(cache_file)
+            if data is not None and data != refresh_from:
+                yield AuthResult(**data)
+                return
+            future, is_leader = begin_auth(cache_file)
+            if is_leader:
+                break
+            if has_running_loop():
+                # Waiting for another thread would block this event loop, authenticate separately
+                future = None
+                break
+            data = wait_auth(future)
+            if data is not None:
+                yield AuthResult(**data)
+                return
+
+        auth_result = None
+
         try:
-            if cache_file.exists():
-                with cache_file.open("r") as f:
-                    auth_result = AuthResult(**json.load(f))
+            if isgeneratorfunction(cls.on_auth):
+                response = tracing.trace("auth", cls.on_auth(**kwargs), provider=cls.__name__)
             else:
-                auth_result = cls.on_auth(**kwargs)
-                for chunk in auth_result:
-                    if hasattr(chunk, "get_dict"):
-                        auth_result = chunk
-                    else:
-                        yield chunk
+                with tracing.start_span("auth", provider=cls.__name__):
+                    response = cls.on_auth(**kwargs)
+            for chunk in [response] if hasattr(response, "get_dict") else response:
+                if hasattr(chunk, "get_dict"):
+                    auth_result = chunk
+                else:
+                    yield chunk
+            if auth_result is None:
+                raise MissingAuthError(f"No auth result from {cls.__name__}")
+            data = auth_result.get_dict()
+            write_auth(cache_file, data)
+        except BaseException as e:
+            delete_auth(cache_file)
+            if future is not None:
+                end_auth(cache_file, future, error=e if isinstance(e, Exception) else None)
+            raise
+
+        if future is not None:
+            end_auth(cache_file, future, data)
+        yield auth_result if isinstance(auth_result, AuthResult) else AuthResult(**data)
+
+    @classmethod
+    async def iter_auth_async(cls, refresh_from: dict = None, **kwargs) -> AsyncIterator:
+        cache_file = cls.get_cache_file()
+
+        while True:
+            data = read_auth(cache_file)
+            if data is not None and data != refresh_from:
+                yield AuthResult(**data)
+                return
+            future, is_leader = begin_auth(cache_file)
+            if is_leader:
+                break
+            data = await wait_auth_async(future)
+            if data is not None:
+                yield AuthResult(**data)
+                return
+
+        auth_result = None
+
+        try:
+            async for chunk in tracing.trace("auth", to_async_iterator(cls.on_auth_async(**kwargs)), provider=cls.__name__):
+                if hasattr(chunk, "get_dict"):
+                    auth_result = chunk
+                else:
+                    yield chunk
+            if auth_result is None:
+                raise MissingAuthError(f"No auth result from {cls.__name__}")
+            data = auth_result.get_dict()
+            write_auth(cache_file, data)
+        except BaseException as e:
+            delete_auth(cache_file)
+            end_auth(cache_file, future, error=e if isinstance(e, Exception) else None)
+            raise
+
+        end_auth(cache_file, future, data)
+        yield auth_result if isinstance(auth_result, AuthResult) else AuthResult(**data)
+
+    @classmethod
+    def create_completion(cls, model: str, messages: Messages, **kwargs) -> CreateResult:
+        auth_result = None
+        cache_file = cls.get_cache_file()
+
+        try:
+            for chunk in cls.iter_auth(**kwargs):
+                if isinstance(chunk, AuthResult):
+                    auth_result = chunk
+                else:
+                    yield chunk
             yield from to_sync_generator(cls.create_authed(model, messages, auth_result, **kwargs))
         except (MissingAuthError, NoValidHarFileError):
-            auth_result = cls.on_auth(**kwargs)
-            for chunk in auth_result:
-                if hasattr(chunk, "get_dict"):
+            if auth_result is None:
+                raise
+            failed, auth_result = auth_result.get_dict(), None
+            for chunk in cls.iter_auth(refresh_from=failed, **kwargs):
+                if isinstance(chunk, AuthResult):
                     auth_result = chunk
                 else:
                     yield chunk
             yield from to_sync_generator(cls.create_authed(model, messages, auth_result, **kwargs))
         finally:
-                if hasattr(auth_result, "get_dict"):
-                    data = auth_result.get_dict()
-                    cache_file.parent.mkdir(parents=True, exist_ok=True)
-                    cache_file.write_text(json.dumps(data))
-                elif cache_file.exists():
-                    cache_file.unlink()
+            if auth_result is not None:
+                write_auth(cache_file, auth_result.get_dict())
 
     @classmethod
     async def create_async_generator(cls, model: str, messages: Messages, **kwargs) -> AsyncResult:
+        auth_result = None
+        cache_file = cls.get_cache_file()
+
         try:
-            auth_result = AuthResult()
-            cache_file = Path(get_cookies_dir()) / f"auth_{cls.parent if hasattr(cls, 'parent') else cls.__name__}.json"
-            if cache_file.exists():
-                with cache_file.open("r") as f:
-                    auth_result = AuthResult(**json.load(f))
-            else:
-                auth_result = cls.on_auth_async(**kwargs)
-                async for chunk in auth_result:
-                    if hasattr(chunk, "get_dict"):
-                        auth_result = chunk
-                    else:
-                        yield chunk
+            async for chunk in cls.iter_auth_async(**kwargs):
+                if isinstance(chunk, AuthResult):
+                    auth_result = chunk
+                else:
+                    yield chunk
             response = to_async_iterator(cls.create_authed(model, messages, **kwargs, auth_result=auth_result))
             async for chunk in response:
                 yield chunk
         except (MissingAuthError, NoValidHarFileError):
-            if cache_file.exists():
-                cache_file.unlink()
-            auth_result = cls.on_auth_async(**kwargs)
-            async for chunk in auth_result:
-                if hasattr(chunk, "get_dict"):
+            if auth_result is None:
+                raise
+            failed, auth_result = auth_result.get_dict(), None
+            async for chunk in cls.iter_auth_async(refresh_from=failed, **kwargs):
+                if isinstance(chunk, AuthResult):
                     auth_result = chunk
                 else:
                     yield chunk
@@ -357,8 +511,5 @@ class AsyncAuthedProvider(AsyncGeneratorProvider):
             async for chunk in response:
                 yield chunk
         finally:
-            if hasattr(auth_result, "get_dict"):
-                cache_file.parent.mkdir(parents=True, exist_ok=True)
-                cache_file.write_text(json.dumps(auth_result.get_dict()))
-            elif cache_file.exists():
-                cache_file.unlink()
\ No newline at end of file
+            if auth_result is not None:
+                write_auth(cache_file, auth_result.get_dict())
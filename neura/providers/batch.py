@@ -0,0 +1,131 @@
+# -----------------------------------------------------------------------------
+# Copyright [2025] [Krisna Pranav, Neura AI]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import time
+import asyncio
+from typing import Callable, Optional
+
+from ..typing import Messages, AsyncIterator
+from .helper import concat_chunks
+
+class BatchResult:
+    def __init__(self, index: int, messages: Messages, response: Optional[str] = None, error: Optional[Exception] = None, duration: float = 0) -> None:
+        self.index = index
+        self.messages = messages
+        self.response = response
+        self.error = error
+        self.duration = duration
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def get_dict(self) -> dict:
+        return {
+            "index": self.index,
+            "response": self.response,
+            "error": None if self.error is None else f"{self.error.__class__.__name__}: {self.error}",
+            "duration": self.duration,
+        }
+
+class BatchStats:
+    def __init__(self, total: int, concurrency: int) -> None:
+        self.total = total
+        self.concurrency = concurrency
+        self.completed = 0
+        self.failed = 0
+        self.characters = 0
+        self.started_at = time.monotonic()
+        self.finished_at: Optional[float] = None
+
+    def add(self, result: BatchResult) -> None:
+        if result.ok:
+            self.completed += 1
+            self.characters += len(result.response or "")
+        else:
+            self.failed += 1
+
+    @property
+    def elapsed(self) -> float:
+        return (time.monotonic() if self.finished_at is None else self.finished_at) - self.started_at
+
+    def get_dict(self) -> dict:
+        elapsed = self.elapsed
+        return {
+            "total": self.total,
+            "concurrency": self.concurrency,
+            "completed": self.completed,
+            "failed": self.failed,
+            "elapsed": elapsed,
+            "requests_per_second": (self.completed + self.failed) / elapsed if elapsed else 0,
+            "characters_per_second": self.characters / elapsed if elapsed else 0,
+        }
+
+class BatchResponse(list):
+    def __init__(self, results: list[BatchResult], stats: BatchStats) -> None:
+        super().__init__(results)
+        self.stats = stats
+
+    @property
+    def errors(self) -> list[BatchResult]:
+        return [result for result in self if not result.ok]
+
+async def create_response(create_function: Callable, model: str, messages: Messages, **kwargs) -> str:
+    response = create_function(model, messages, **kwargs)
+
+    if hasattr(response, "__aiter__"):
+        return concat_chunks([chunk async for chunk in response])
+
+    response = await response
+    return response if isinstance(response, str) else concat_chunks(response)
+
+def iter_batch(create_function: Callable, model: str, messages_list: list[Messages], concurrency: int = 5, stats: BatchStats = None, **kwargs) -> AsyncIterator[BatchResult]:
+    # Checked before the generator starts, a semaphore of 0 would wait forever
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+    return run_batch(create_function, model, messages_list, concurrency, stats, **kwargs)
+
+async def run_batch(create_function: Callable, model: str, messages_list: list[Messages], concurrency: int = 5, stats: BatchStats = None, **kwargs) -> AsyncIterator[BatchResult]:
+    stats = BatchStats(len(messages_list), concurrency) if stats is None else stats
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(index: int, messages: Messages) -> BatchResult:
+        async with semaphore:
+            start = time.monotonic()
+            try:
+                response = await create_response(create_function, model, messages, **kwargs)
+                result = BatchResult(index, messages, response=response, duration=time.monotonic() - start)
+            except Exception as e:
+                result = BatchResult(index, messages, error=e, duration=time.monotonic() - start)
+            stats.add(result)
+            return result
+
+    tasks = [asyncio.ensure_future(run(index, messages)) for index, messages in enumerate(messages_list)]
+
+    try:
+        for future in asyncio.as_completed(tasks):
+            yield await future
+    finally:
+        for task in tasks:
+            task.cancel()
+        stats.finished_at = time.monotonic()
+
+async def create_batch(create_function: Callable, model: str, messages_list: list[Messages], concurrency: int = 5, **kwargs) -> BatchResponse:
+    stats = BatchStats(len(messages_list), concurrency)
+    results = [result async for result in iter_batch(create_function, model, messages_list, concurrency, stats, **kwargs)]
+    return BatchResponse(sorted(results, key=lambda result: result.index), stats)
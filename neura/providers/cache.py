@@ -0,0 +1,268 @@
+# -----------------------------------------------------------------------------
+# Copyright [2025] [Krisna Pranav, Neura AI]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import os
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from collections import OrderedDict
+from typing import Optional
+
+from .. import debug
+from ..typing import Messages, CreateResult, AsyncResult
+from ..cookies import get_cookies_dir
+from .types import BaseProvider, ProviderType
+from .response import ResponseType, BaseConversation, FinishReason, Usage, ProviderInfo, Sources, Reasoning, ImageResponse
+
+# The request key is a SHA-256 digest, so credentials such as api_key are part of it without being stored
+IGNORED_PARAMETERS = ["proxy", "timeout", "max_retries", "ignore_stream", "ignored"]
+
+def get_request_key(provider: str, model: str, messages: Messages, **kwargs) -> Optional[str]:
+    data = {
+        "provider": provider,
+        "model": model,
+        "messages": messages,
+        **{key: value for key, value in kwargs.items() if key not in IGNORED_PARAMETERS},
+    }
+
+    try:
+        data = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    except (TypeError, ValueError):
+        return None
+
+    return hashlib.sha256(data.encode()).hexdigest()
+
+def serialize_chunk(chunk) -> Optional[dict]:
+    if isinstance(chunk, str):
+        return chunk
+    elif isinstance(chunk, FinishReason):
+        return {"type": "FinishReason", "reason": chunk.reason}
+    elif isinstance(chunk, (Usage, ProviderInfo)):
+        return {"type": chunk.__class__.__name__, "data": chunk.get_dict()}
+    elif isinstance(chunk, Sources):
+        return {"type": "Sources", "sources": chunk.list}
+    elif isinstance(chunk, Reasoning):
+        return {"type": "Reasoning", "token": chunk.token, "status": chunk.status, "is_thinking": chunk.is_thinking}
+    elif isinstance(chunk, ImageResponse) and chunk.__class__ is ImageResponse:
+        return {"type": "ImageResponse", "images": chunk.images, "alt": chunk.alt, "options": chunk.options}
+    return None
+
+def deserialize_chunk(data):
+    if isinstance(data, str):
+        return data
+    elif data["type"] == "FinishReason":
+        return FinishReason(data["reason"])
+    elif data["type"] == "Usage":
+        return Usage(**data["data"])
+    elif data["type"] == "ProviderInfo":
+        return ProviderInfo(**data["data"])
+    elif data["type"] == "Sources":
+        return Sources(data["sources"])
+    elif data["type"] == "Reasoning":
+        return Reasoning(data["token"], data["status"], data["is_thinking"])
+    elif data["type"] == "ImageResponse":
+        return ImageResponse(data["images"], data["alt"], data["options"])
+    raise ValueError(f"Unknown chunk type: {data['type']}")
+
+def get_chunk_size(chunk) -> int:
+    return len(chunk) if isinstance(chunk, str) else 64
+
+class ResponseCache:
+    def __init__(self, max_entries: int = 1024, max_size: int = 64 * 1024 * 1024, ttl: Optional[float] = 3600, disk: bool = False, disk_dir: Optional[str] = None) -> None:
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.ttl = ttl
+        self.disk = disk
+        self.disk_dir = disk_dir
+        self.entries: OrderedDict[str, tuple[Optional[float], int, list]] = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get_disk_dir(self) -> Path:
+        return Path(get_cookies_dir() if self.disk_dir is None else self.disk_dir) / ".cache" / "responses"
+
+    def get(self, key: str) -> Optional[list]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                expires_at, _, chunks = entry
+                if expires_at is None or expires_at > time.time():
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return chunks
+                self._remove(key)
+
+        chunks = self._read_disk(key) if self.disk else None
+
+        with self.lock:
+            if chunks is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        self._store(key, chunks, write_disk=False)
+        return chunks
+
+    def set(self, key: str, chunks: list) -> None:
+        if any(isinstance(chunk, (Exception, BaseConversation)) for chunk in chunks):
+            return
+
+        self._store(key, chunks, write_disk=self.disk)
+
+    def _store(self, key: str, chunks: list, write_disk: bool) -> None:
+        size = sum(get_chunk_size(chunk) for chunk in chunks)
+
+        if size > self.max_size:
+            return
+
+        expires_at = None if self.ttl is None else time.time() + self.ttl
+
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = (expires_at, size, chunks)
+            self.size += size
+            while self.entries and (len(self.entries) > self.max_entries or self.size > self.max_size):
+                self._remove(next(iter(self.entries)))
+
+        if write_disk:
+            self._write_disk(key, expires_at, chunks)
+
+    def _remove(self, key: str) -> None:
+        _, size, _ = self.entries.pop(key)
+        self.size -= size
+
+    def _read_disk(self, key: str) -> Optional[list]:
+        cache_file = self.get_disk_dir() / f"{key}.json"
+
+        try:
+            with cache_file.open("r") as f:
+                data = json.load(f)
+            if data["expires_at"] is not None and data["expires_at"] <= time.time():
+                cache_file.unlink(missing_ok=True)
+                return None
+            return [deserialize_chunk(chunk) for chunk in data["chunks"]]
+        except (OSError, KeyError, TypeError, ValueError):
+            return None
+
+    def _write_disk(self, key: str, expires_at: Optional[float], chunks: list) -> None:
+        serialized = []
+
+        for chunk in chunks:
+            data = serialize_chunk(chunk)
+            if data is None:
+                return
+            serialized.append(data)
+
+        cache_dir = self.get_disk_dir()
+        cache_file = cache_dir / f"{key}.json"
+        tmp_file = cache_dir / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_text(json.dumps({"expires_at": expires_at, "chunks": serialized}))
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            debug.log(f"Failed to write response cache: {e.__class__.__name__}: {e}")
+            try:
+                tmp_file.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def clear(self, disk: bool = True) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+        if disk and self.disk and self.get_disk_dir().exists():
+            for cache_file in self.get_disk_dir().glob("*.json"):
+                cache_file.unlink(missing_ok=True)
+
+    def get_stats(self) -> dict[str, int]:
+        with self.lock:
+            return {
+                "entries": len(self.entries),
+                "size": self.size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+class CachedProvider(BaseProvider):
+    def __init__(self, provider: ProviderType, cache: ResponseCache = None) -> None:
+        self.provider = provider
+        self.cache = ResponseCache() if cache is None else cache
+        self.__name__ = provider.__name__
+        self.url = provider.url
+        self.working = provider.working
+        self.supports_stream = provider.supports_stream
+        self.supports_message_history = provider.supports_message_history
+        self.supports_system_message = provider.supports_system_message
+
+    def get_key(self, model: str, messages: Messages, stream: bool, **kwargs) -> Optional[str]:
+        return get_request_key(self.provider.__name__, model, messages, stream=stream, **kwargs)
+
+    def create_completion(self, model: str, messages: Messages, stream: bool = False, **kwargs) -> CreateResult:
+        key = self.get_key(model, messages, stream, **kwargs)
+        chunks = None if key is None else self.cache.get(key)
+
+        if chunks is not None:
+            yield from chunks
+            return
+
+        chunks = []
+
+        for chunk in self.provider.get_create_function()(model, messages, stream=stream, **kwargs):
+            chunks.append(chunk)
+            yield chunk
+
+        if key is not None:
+            self.cache.set(key, chunks)
+
+    async def create_async_generator(self, model: str, messages: Messages, stream: bool = True, **kwargs) -> AsyncResult:
+        key = self.get_key(model, messages, stream, **kwargs)
+        chunks = None if key is None else self.cache.get(key)
+
+        if chunks is not None:
+            for chunk in chunks:
+                yield chunk
+            return
+
+        chunks = []
+        response = self.provider.get_async_create_function()(model, messages, stream=stream, **kwargs)
+
+        if hasattr(response, "__aiter__"):
+            async for chunk in response:
+                chunks.append(chunk)
+                yield chunk
+        else:
+            response = await response
+            chunks.append(response)
+            yield response
+
+        if key is not None:
+            self.cache.set(key, chunks)
+
+    def get_create_function(self) -> callable:
+        return self.create_completion
+
+    def get_async_create_function(self) -> callable:
+        return self.create_async_generator
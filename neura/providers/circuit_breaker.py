@@ -0,0 +1,128 @@
+# -----------------------------------------------------------------------------
+# Copyright [2025] [Krisna Pranav, Neura AI]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import time
+import threading
+from typing import Optional
+
+from .types import ProviderType
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 5, cooldown: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probe_started_at: Optional[float] = None
+        self.lock = threading.Lock()
+
+    def is_available(self) -> bool:
+        if self.state == CLOSED:
+            return True
+        now = time.monotonic()
+        if self.state == OPEN:
+            return now - self.opened_at >= self.cooldown
+        return self.probe_started_at is None or now - self.probe_started_at >= self.cooldown
+
+    def allow_request(self) -> bool:
+        with self.lock:
+            if not self.is_available():
+                return False
+            if self.state != CLOSED:
+                self.state = HALF_OPEN
+                self.probe_started_at = time.monotonic()
+            return True
+
+    def release_probe(self) -> None:
+        with self.lock:
+            if self.state == HALF_OPEN:
+                self.probe_started_at = None
+
+    def record_success(self) -> None:
+        with self.lock:
+            self.state = CLOSED
+            self.failures = 0
+            self.opened_at = None
+            self.probe_started_at = None
+
+    def record_failure(self) -> None:
+        with self.lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                self.probe_started_at = None
+
+    def reset(self) -> None:
+        self.record_success()
+
+    def get_dict(self) -> dict:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "failure_threshold": self.failure_threshold,
+            "cooldown": self.cooldown,
+            "retry_in": max(0.0, self.opened_at + self.cooldown - time.monotonic()) if self.state == OPEN else 0.0,
+        }
+
+class CircuitBreakers:
+    def __init__(self, failure_threshold: int = 5, cooldown: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self.lock = threading.Lock()
+
+    def get(self, provider: ProviderType) -> CircuitBreaker:
+        name = provider.__name__
+        breaker = self.breakers.get(name)
+
+        if breaker is None:
+            with self.lock:
+                if name not in self.breakers:
+                    self.breakers[name] = CircuitBreaker(
+                        getattr(provider, "failure_threshold", self.failure_threshold),
+                        getattr(provider, "circuit_cooldown", self.cooldown),
+                    )
+                breaker = self.breakers[name]
+
+        return breaker
+
+    def configure(self, provider: ProviderType, failure_threshold: int = None, cooldown: float = None) -> CircuitBreaker:
+        breaker = self.get(provider)
+
+        if failure_threshold is not None:
+            breaker.failure_threshold = failure_threshold
+        if cooldown is not None:
+            breaker.cooldown = cooldown
+
+        return breaker
+
+    def get_states(self) -> dict[str, dict]:
+        return {name: breaker.get_dict() for name, breaker in list(self.breakers.items())}
+
+    def reset(self, provider: ProviderType = None) -> None:
+        for name, breaker in list(self.breakers.items()):
+            if provider is None or provider.__name__ == name:
+                breaker.reset()
+
+circuit_breakers = CircuitBreakers()
@@ -14,9 +14,10 @@
 # limitations under the License.
 # -----------------------------------------------------------------------------
 
+from __future__ import annotations
+
 import re
 import asyncio
-from __future__ import annotations
 from .. import debug
 from ..typing import CreateResult, Messages
 from .types import BaseProvider, ProviderType
@@ -0,0 +1,178 @@
+# -----------------------------------------------------------------------------
+# Copyright [2025] [Krisna Pranav, Neura AI]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Callable, Any, Optional
+
+from ..errors import ProviderBusyError
+
+class ProviderExecutor:
+    def __init__(self, name: str, max_workers: int = 4, max_queue_size: Optional[int] = None, block: bool = True) -> None:
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.block = block
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"neura-{name}")
+        self.lock = threading.Lock()
+        self.waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        self.queued = 0
+        self.active = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def is_full(self) -> bool:
+        if self.max_queue_size is None:
+            return False
+        return self.queued + self.active >= self.max_workers + self.max_queue_size
+
+    async def run(self, func: Callable, *args) -> Any:
+        loop = asyncio.get_running_loop()
+
+        while not self._reserve():
+            if not self.block:
+                with self.lock:
+                    self.rejected += 1
+                raise ProviderBusyError(f"Executor of {self.name} is full: {self.active} active, {self.queued} queued")
+
+            waiter = loop.create_future()
+            with self.lock:
+                self.waiters.append((loop, waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self._wake_waiter()
+                raise
+            finally:
+                with self.lock:
+                    if (loop, waiter) in self.waiters:
+                        self.waiters.remove((loop, waiter))
+
+        future = self.executor.submit(self._call, func, *args)
+        future.add_done_callback(self._on_done)
+        return await asyncio.wrap_future(future, loop=loop)
+
+    def _reserve(self) -> bool:
+        with self.lock:
+            if self.is_full():
+                return False
+            self.queued += 1
+            return True
+
+    def _call(self, func: Callable, *args) -> Any:
+        with self.lock:
+            self.queued -= 1
+            self.active += 1
+
+        try:
+            return func(*args)
+        finally:
+            with self.lock:
+                self.active -= 1
+                self.completed += 1
+
+    def _on_done(self, future: Future) -> None:
+        if future.cancelled():
+            with self.lock:
+                self.queued -= 1
+        self._wake_waiter()
+
+    def _wake_waiter(self) -> None:
+        while True:
+            with self.lock:
+                if not self.waiters:
+                    return
+                loop, waiter = self.waiters.popleft()
+            try:
+                loop.call_soon_threadsafe(_set_waiter_result, waiter)
+                return
+            except RuntimeError:
+                continue
+
+    def get_stats(self) -> dict[str, int]:
+        with self.lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue_size": self.max_queue_size,
+                "active": self.active,
+                "queued": self.queued,
+                "waiting": len(self.waiters),
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        self.executor.shutdown(wait=wait)
+
+def _set_waiter_result(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+class ExecutorRegistry:
+    executors: dict[type, ProviderExecutor] = {}
+    lock: threading.Lock = threading.Lock()
+
+def get_executor_name(provider: type) -> str:
+    return f"{provider.__module__}.{provider.__qualname__}"
+
+def get_executor(provider: type) -> Optional[ProviderExecutor]:
+    executor = ExecutorRegistry.executors.get(provider)
+
+    if executor is not None:
+        return executor
+
+    max_workers = getattr(provider, "max_workers", None)
+
+    if max_workers is None:
+        return None
+
+    with ExecutorRegistry.lock:
+        if provider not in ExecutorRegistry.executors:
+            ExecutorRegistry.executors[provider] = ProviderExecutor(
+                provider.__name__,
+                max_workers=max_workers,
+                max_queue_size=getattr(provider, "max_queue_size", None),
+                block=getattr(provider, "block_when_busy", True),
+            )
+        return ExecutorRegistry.executors[provider]
+
+def configure_executor(provider: type, max_workers: int = 4, max_queue_size: Optional[int] = None, block: bool = True) -> ProviderExecutor:
+    executor = ProviderExecutor(provider.__name__, max_workers, max_queue_size, block)
+
+    with ExecutorRegistry.lock:
+        previous = ExecutorRegistry.executors.get(provider)
+        ExecutorRegistry.executors[provider] = executor
+
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+    return executor
+
+def get_executor_stats() -> dict[str, dict[str, int]]:
+    return {get_executor_name(provider): executor.get_stats() for provider, executor in list(ExecutorRegistry.executors.items())}
+
+def shutdown_executors(wait: bool = True) -> None:
+    with ExecutorRegistry.lock:
+        executors = list(ExecutorRegistry.executors.values())
+        ExecutorRegistry.executors.clear()
+
+    for executor in executors:
+        executor.shutdown(wait=wait)
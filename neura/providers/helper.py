@@ -14,9 +14,11 @@
 # limitations under the License.
 # -----------------------------------------------------------------------------
 
+from __future__ import annotations
+
 import random
 import string
-from __future__ import annotations
+import asyncio
 from ..typing import Messages, Cookies, AsyncIterator, Iterator
 from .. import debug
 
@@ -80,5 +82,63 @@ def concat_chunks(chunks: Iterator) -> str:
         if chunk and not isinstance(chunk, Exception)
     ])
 
+async def coalesce_chunks(chunks: AsyncIterator, max_size: int = 1024, max_latency: float = 0.05) -> AsyncIterator:
+    loop = asyncio.get_running_loop()
+    iterator = chunks.__aiter__()
+    pending = None
+    buffer = []
+    size = 0
+    deadline = None
+
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+
+            if buffer and deadline is not None:
+                timeout = deadline - loop.time()
+                if timeout > 0:
+                    await asyncio.wait((pending,), timeout=timeout)
+                if not pending.done():
+                    yield "".join(buffer)
+                    buffer, size = [], 0
+                    continue
+
+            try:
+                chunk = await pending
+            except StopAsyncIteration:
+                break
+            finally:
+                if pending.done():
+                    pending = None
+
+            if isinstance(chunk, str):
+                if not chunk:
+                    continue
+                if not buffer and max_latency is not None:
+                    deadline = loop.time() + max_latency
+                buffer.append(chunk)
+                size += len(chunk.encode())
+                if size >= max_size:
+                    yield "".join(buffer)
+                    buffer, size = [], 0
+            else:
+                if buffer:
+                    yield "".join(buffer)
+                    buffer, size = [], 0
+                yield chunk
+
+        if buffer:
+            yield "".join(buffer)
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+            try:
+                await pending
+            except BaseException:
+                pass
+        if hasattr(iterator, "aclose"):
+            await iterator.aclose()
+
 def format_cookies(cookies: Cookies) -> str:
     return "; ".join([f"{k}={v}" for k, v in cookies.items()])
\ No newline at end of file
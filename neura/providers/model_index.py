@@ -0,0 +1,148 @@
+# -----------------------------------------------------------------------------
+# Copyright [2025] [Krisna Pranav, Neura AI]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import threading
+from enum import IntFlag
+from collections import OrderedDict
+
+from .types import ProviderType
+
+class Capability(IntFlag):
+    NONE = 0
+    STREAM = 1
+    SYSTEM_MESSAGE = 2
+    MESSAGE_HISTORY = 4
+    IMAGE = 8
+    VISION = 16
+
+def get_capabilities(provider: ProviderType, model: str = None) -> Capability:
+    capabilities = Capability.NONE
+
+    if provider.supports_stream:
+        capabilities |= Capability.STREAM
+    if provider.supports_system_message:
+        capabilities |= Capability.SYSTEM_MESSAGE
+    if provider.supports_message_history:
+        capabilities |= Capability.MESSAGE_HISTORY
+    if model is not None and model in getattr(provider, "image_models", []):
+        capabilities |= Capability.IMAGE
+    if model is not None and model in getattr(provider, "vision_models", []):
+        capabilities |= Capability.VISION
+
+    return capabilities
+
+def get_fingerprint(providers: list[ProviderType]) -> tuple:
+    # Identity and size of each model list, catches reassigned and resized lists without hashing them
+    fingerprint = []
+    for provider in providers:
+        models = getattr(provider, "models", None) or ()
+        fingerprint += (id(models), len(models), getattr(provider, "default_model", None))
+    return tuple(fingerprint)
+
+class ModelIndex:
+    def __init__(self, providers: list[ProviderType] = None, max_results: int = 1024) -> None:
+        self.providers = [] if providers is None else providers
+        self.max_results = max_results
+        self.index: dict[str, list[tuple[ProviderType, Capability]]] = {}
+        self.wildcards: list[ProviderType] = []
+        self.results: OrderedDict[tuple[str, Capability], tuple[ProviderType, ...]] = OrderedDict()
+        self.version = 0
+        self.built_version = None
+        self.fingerprint = None
+        self.lock = threading.Lock()
+
+    def register(self, provider: ProviderType) -> None:
+        if provider not in self.providers:
+            self.providers.append(provider)
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        # Needed when a model list is edited in place without changing its length
+        with self.lock:
+            self.version += 1
+
+    def _check(self) -> None:
+        fingerprint = get_fingerprint(self.providers)
+        if self.built_version == self.version and self.fingerprint == fingerprint:
+            return
+
+        with self.lock:
+            if self.built_version != self.version or self.fingerprint != fingerprint:
+                self._rebuild()
+                self.built_version = self.version
+                self.fingerprint = fingerprint
+
+    def _rebuild(self) -> None:
+        index = {}
+        wildcards = []
+
+        for provider in self.providers:
+            models = list(getattr(provider, "models", None) or [])
+            default_model = getattr(provider, "default_model", None)
+
+            if not models:
+                wildcards.append(provider)
+                if default_model is None:
+                    continue
+
+            names = set(models)
+            names.update(getattr(provider, "model_aliases", {}) or {})
+            names.update(getattr(provider, "image_models", []) or [])
+            names.update(getattr(provider, "vision_models", []) or [])
+            if default_model is not None:
+                names.add(default_model)
+
+            for name in names:
+                index.setdefault(name, []).append((provider, get_capabilities(provider, name)))
+
+        self.index = index
+        self.wildcards = wildcards
+        self.results.clear()
+
+    def get_providers(self, model: str, capabilities: Capability = Capability.NONE) -> tuple[ProviderType, ...]:
+        self._check()
+        key = (model, capabilities)
+
+        with self.lock:
+            result = self.results.get(key)
+            if result is not None:
+                self.results.move_to_end(key)
+                return result
+
+            if not model:
+                matches = {provider: get_capabilities(provider) for provider in self.providers}
+            else:
+                matches = {provider: get_capabilities(provider, model) for provider in self.wildcards}
+                matches.update(self.index.get(model, []))
+            result = tuple(
+                provider for provider in self.providers
+                if provider in matches and matches[provider] & capabilities == capabilities
+            )
+            self.results[key] = result
+            while len(self.results) > self.max_results:
+                self.results.popitem(last=False)
+
+        return result
+
+    def get_capabilities(self, model: str) -> dict[str, Capability]:
+        self._check()
+        return {provider.__name__: flags for provider, flags in self.index.get(model, [])}
+
+    def get_models(self) -> list[str]:
+        self._check()
+        return list(self.index)
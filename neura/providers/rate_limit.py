@@ -0,0 +1,137 @@
+# -----------------------------------------------------------------------------
+# Copyright [2025] [Krisna Pranav, Neura AI]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import time
+import threading
+from typing import Optional
+
+from ..typing import Messages
+from .types import ProviderType
+
+def estimate_tokens(messages: Messages) -> int:
+    characters = 0
+
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, str):
+            characters += len(content)
+        elif isinstance(content, list):
+            characters += sum(len(part.get("text", "")) for part in content if isinstance(part, dict))
+
+    return characters // 4 + 1
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def get_wait_time(self, amount: float) -> float:
+        self.refill()
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float) -> None:
+        self.tokens -= min(amount, self.capacity)
+
+    def get_dict(self) -> dict:
+        self.refill()
+        return {"rate": self.rate, "capacity": self.capacity, "tokens": self.tokens}
+
+class RateLimiter:
+    def __init__(self, requests_per_second: float = None, tokens_per_minute: float = None, burst: float = None) -> None:
+        self.requests = None if requests_per_second is None else TokenBucket(requests_per_second, max(1.0, requests_per_second) if burst is None else burst)
+        self.tokens = None if tokens_per_minute is None else TokenBucket(tokens_per_minute / 60, tokens_per_minute)
+        self.limited = 0
+        self.lock = threading.Lock()
+
+    def get_wait_time(self, tokens: int = 0) -> float:
+        with self.lock:
+            return self._get_wait_time(tokens)
+
+    def _get_wait_time(self, tokens: int) -> float:
+        wait = 0.0
+        if self.requests is not None:
+            wait = max(wait, self.requests.get_wait_time(1))
+        if self.tokens is not None and tokens:
+            wait = max(wait, self.tokens.get_wait_time(tokens))
+        return wait
+
+    def check(self, tokens: int = 0, max_wait: float = 0.0) -> Optional[float]:
+        with self.lock:
+            wait = self._get_wait_time(tokens)
+            if wait > max_wait:
+                self.limited += 1
+                return None
+            return wait
+
+    def try_acquire(self, tokens: int = 0) -> bool:
+        with self.lock:
+            if self._get_wait_time(tokens) > 0:
+                self.limited += 1
+                return False
+            if self.requests is not None:
+                self.requests.consume(1)
+            if self.tokens is not None and tokens:
+                self.tokens.consume(tokens)
+            return True
+
+    def get_dict(self) -> dict:
+        with self.lock:
+            return {
+                "requests": None if self.requests is None else self.requests.get_dict(),
+                "tokens": None if self.tokens is None else self.tokens.get_dict(),
+                "limited": self.limited,
+            }
+
+class RateLimiters:
+    def __init__(self) -> None:
+        self.limiters: dict[str, Optional[RateLimiter]] = {}
+        self.lock = threading.Lock()
+
+    def get(self, provider: ProviderType) -> Optional[RateLimiter]:
+        name = provider.__name__
+
+        if name not in self.limiters:
+            with self.lock:
+                if name not in self.limiters:
+                    rate_limit = getattr(provider, "rate_limit", None)
+                    self.limiters[name] = None if not rate_limit else RateLimiter(**rate_limit)
+
+        return self.limiters[name]
+
+    def configure(self, provider: ProviderType, requests_per_second: float = None, tokens_per_minute: float = None, burst: float = None) -> RateLimiter:
+        limiter = RateLimiter(requests_per_second, tokens_per_minute, burst)
+
+        with self.lock:
+            self.limiters[provider.__name__] = limiter
+
+        return limiter
+
+    def get_states(self) -> dict[str, dict]:
+        return {name: limiter.get_dict() for name, limiter in list(self.limiters.items()) if limiter is not None}
+
+rate_limiters = RateLimiters()
@@ -14,8 +14,9 @@
 # limitations under the License.
 # -----------------------------------------------------------------------------
 
-import re
 from __future__ import annotations
+
+import re
 from typing import Union
 from abc import abstractmethod
 from urllib.parse import quote_plus, unquote_plus
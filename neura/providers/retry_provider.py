@@ -14,129 +14,450 @@
 # limitations under the License.
 # -----------------------------------------------------------------------------
 
-import random
 from __future__ import annotations
-from ..typing import Type, List, CreateResult, Messages, AsyncResult
+
+import time
+import random
+import asyncio
+import threading
+from ..typing import Type, List, CreateResult, Messages, AsyncResult, AsyncIterator, Iterator, Optional
 from .types import BaseProvider, BaseRetryProvider, ProviderType
 from .response import ImageResponse, ProviderInfo
-from .. import debug
-from ..errors import RetryProviderError, RetryNoProviderError
+from .asyncio import to_sync_generator, to_async_iterator
+from .scoring import ProviderScores, CallStats
+from .circuit_breaker import CircuitBreakers
+from .backoff import RetryPolicy
+from .model_index import ModelIndex, Capability
+from .rate_limit import RateLimiters, estimate_tokens
+from .batch import BatchResponse, BatchResult, BatchStats, create_batch, iter_batch
+from .. import debug, metrics, tracing
+from ..errors import RetryProviderError, RetryNoProviderError, TimeoutError
 
 class IterListProvider(BaseRetryProvider):
-    def __init__(self, providers: List[Type[BaseProvider]], shuffle: bool = True) -> None:
+    def __init__(self, providers: List[Type[BaseProvider]], shuffle: bool = True, scores: ProviderScores = None, hedge_delay: float = None, hedge_budget: float = 0.1, hedge_burst: float = 3, circuit_breakers: CircuitBreakers = None, first_token_timeout: float = None, inter_chunk_timeout: float = None, rate_limiters: RateLimiters = None, rate_limit_wait: float = 0, resume: bool = False, model_routing: bool = False, strict_parameters: Optional[bool] = None) -> None:
         self.providers = providers
         self.shuffle = shuffle
+        self.scores = scores
+        self.circuit_breakers = circuit_breakers
+        self.first_token_timeout = first_token_timeout
+        self.inter_chunk_timeout = inter_chunk_timeout
+        self.rate_limiters = rate_limiters
+        self.rate_limit_wait = rate_limit_wait
+        self.resume = resume
+        self.model_index = ModelIndex(providers) if model_routing else None
+        self.strict_parameters = strict_parameters
+        self.hedge_delay = hedge_delay
+        self.hedge_budget = hedge_budget
+        self.hedge_burst = hedge_burst
+        self.hedge_tokens = hedge_burst
+        self.hedge_lock = threading.Lock()
         self.working = True
         self.last_provider: Type[BaseProvider] = None
 
+    @tracing.traced
     def create_completion(self, model: str, messages: Messages, stream: bool = False, ignore_stream: bool = False, ignored: list[str] = [], **kwargs,) -> CreateResult:
+        if self.hedge_delay is not None or self.has_timeouts():
+            yield from to_sync_generator(IterListProvider.create_async_generator(self, model, messages, stream, ignore_stream, ignored, **kwargs))
+            return
+
         exceptions = {}
         started: bool = False
+        content: Optional[list[str]] = [] if self.resume else None
 
-        for provider in self.get_providers(stream and not ignore_stream, ignored):
+        for provider in self.get_providers(stream and not ignore_stream, ignored, model):
+            if not self.acquire_provider(provider, messages):
+                continue
             self.last_provider = provider
             debug.log(f"Using {provider.__name__} provider")
             
             yield ProviderInfo(**provider.get_dict(), model=model if model else getattr(provider, "default_model"))
+            stats = CallStats()
+            splicer = ContinuationSplicer("".join(content)) if started else None
             
             try:
-                response = provider.get_create_function()(model, messages, stream=stream, **kwargs)
-                for chunk in response:
+                request_messages, request_kwargs = self.get_continuation(provider, messages, kwargs, splicer)
+                response = tracing.trace("provider", provider.get_create_function()(model, request_messages, stream=stream, **request_kwargs), provider=provider.__name__, model=model)
+                for chunk in response if splicer is None else splicer.iter_spliced(response):
                     if chunk:
+                        stats.add_chunk(chunk)
+                        content = track_content(content, chunk)
                         yield chunk
                         if isinstance(chunk, str) or isinstance(chunk, ImageResponse):
                             started = True
-                if started:
+                if started and (splicer is None or splicer.received):
+                    self.record_success(provider, model, stats)
                     return
+                self.record_error(provider, model, stats)
             except Exception as e:
+                self.record_error(provider, model, stats, e, not started or bool(content))
                 exceptions[provider.__name__] = e
                 debug.log(f"{provider.__name__}: {e.__class__.__name__}: {e}")
-                if started:
+                if started and not content:
                     raise e
-                yield e
+                if not started:
+                    yield e
 
         raise_exceptions(exceptions)
 
+    @tracing.traced
     async def create_async_generator(self, model: str, messages: Messages, stream: bool = True, ignore_stream: bool = False, ignored: list[str] = [], **kwargs) -> AsyncResult:
+        if self.hedge_delay is not None:
+            async for chunk in self.create_hedged_generator(model, messages, stream, ignore_stream, ignored, **kwargs):
+                yield chunk
+            return
+
         exceptions = {}
         started: bool = False
+        content: Optional[list[str]] = [] if self.resume else None
 
-        for provider in self.get_providers(stream and not ignore_stream, ignored):
+        for provider in self.get_providers(stream and not ignore_stream, ignored, model):
+            if not await self.acquire_provider_async(provider, messages):
+                continue
             self.last_provider = provider
             debug.log(f"Using {provider.__name__} provider")
             
             yield ProviderInfo(**provider.get_dict())
+            stats = CallStats()
+            splicer = ContinuationSplicer("".join(content)) if started else None
             
             try:
-                response = provider.get_async_create_function()(model, messages, stream=stream, **kwargs)
+                request_messages, request_kwargs = self.get_continuation(provider, messages, kwargs, splicer)
+                response = self.apply_timeouts(provider, tracing.trace("provider", provider.get_async_create_function()(model, request_messages, stream=stream, **request_kwargs), provider=provider.__name__, model=model))
                 if hasattr(response, "__aiter__"):
-                    async for chunk in response:
+                    async for chunk in response if splicer is None else splicer.aiter_spliced(response):
                         if chunk:
+                            stats.add_chunk(chunk)
+                            content = track_content(content, chunk)
                             yield chunk
                             if isinstance(chunk, str) or isinstance(chunk, ImageResponse):
                                 started = True
                 elif response:
                     response = await response
+                    if response and splicer is not None and isinstance(response, str):
+                        response = splicer.feed(response) + splicer.flush()
                     if response:
+                        stats.add_chunk(response)
+                        content = track_content(content, response)
                         yield response
                         started = True
-                if started:
+                if started and (splicer is None or splicer.received):
+                    self.record_success(provider, model, stats)
                     return
+                self.record_error(provider, model, stats)
             except Exception as e:
+                self.record_error(provider, model, stats, e, not started or bool(content))
                 exceptions[provider.__name__] = e
                 debug.log(f"{provider.__name__}: {e.__class__.__name__}: {e}")
-                if started:
+                if started and not content:
                     raise e
-                yield e
+                if not started:
+                    yield e
+
+        raise_exceptions(exceptions)
+
+    async def create_hedged_generator(self, model: str, messages: Messages, stream: bool = True, ignore_stream: bool = False, ignored: list[str] = [], **kwargs) -> AsyncResult:
+        providers = self.get_providers(stream and not ignore_stream, ignored, model)
+        queue = asyncio.Queue()
+        racers: dict[int, asyncio.Task] = {}
+        losers: list[asyncio.Task] = []
+        buffers: dict[int, list] = {}
+        exceptions = {}
+        started = 0
+        winner = None
+        can_hedge = True
+        with self.hedge_lock:
+            self.hedge_tokens = min(self.hedge_tokens + self.hedge_budget, self.hedge_burst)
+
+        async def race(index: int, provider: ProviderType) -> None:
+            stats = CallStats()
+            try:
+                response = self.apply_timeouts(provider, tracing.trace("provider", provider.get_async_create_function()(model, messages, stream=stream, **self.get_provider_kwargs(provider, kwargs)), provider=provider.__name__, model=model))
+                async for chunk in to_async_iterator(response):
+                    if chunk:
+                        stats.add_chunk(chunk)
+                        queue.put_nowait((index, "chunk", chunk))
+                if stats.chunks:
+                    self.record_success(provider, model, stats)
+                else:
+                    self.record_error(provider, model, stats)
+                queue.put_nowait((index, "done", None))
+            except Exception as e:
+                self.record_error(provider, model, stats, e)
+                queue.put_nowait((index, "error", e))
+
+        def start_next() -> bool:
+            nonlocal started
+            while started < len(providers) and not self.acquire_provider(providers[started], messages, wait=False):
+                started += 1
+            if started >= len(providers):
+                return False
+            provider = providers[started]
+            debug.log(f"Using {provider.__name__} provider" + (" (hedged)" if racers else ""))
+            buffers[started] = [ProviderInfo(**provider.get_dict())]
+            racers[started] = asyncio.ensure_future(race(started, provider))
+            started += 1
+            return True
+
+        start_next()
+
+        try:
+            while racers:
+                timeout = self.hedge_delay if winner is None and can_hedge and started < len(providers) else None
+                try:
+                    index, kind, value = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    if self.take_hedge_token():
+                        start_next()
+                    else:
+                        can_hedge = False
+                    continue
+
+                if winner is not None and index != winner:
+                    continue
+
+                if kind == "chunk":
+                    if winner is not None:
+                        yield value
+                        continue
+                    buffers[index].append(value)
+                    if isinstance(value, str) or isinstance(value, ImageResponse):
+                        winner = index
+                        self.last_provider = providers[index]
+                        for loser, task in list(racers.items()):
+                            if loser != index:
+                                task.cancel()
+                                losers.append(racers.pop(loser))
+                        for chunk in buffers.pop(index):
+                            yield chunk
+                    continue
+
+                del racers[index]
+
+                if kind == "done":
+                    if index == winner:
+                        return
+                elif index == winner:
+                    raise value
+                else:
+                    exceptions[providers[index].__name__] = value
+                    debug.log(f"{providers[index].__name__}: {value.__class__.__name__}: {value}")
+                    yield value
+
+                if not racers:
+                    start_next()
+        finally:
+            for task in racers.values():
+                task.cancel()
+            # Wait for cancelled racers so their generators are cleaned up on this loop
+            if racers or losers:
+                await asyncio.gather(*racers.values(), *losers, return_exceptions=True)
 
         raise_exceptions(exceptions)
 
+    def take_hedge_token(self) -> bool:
+        with self.hedge_lock:
+            if self.hedge_tokens >= 1:
+                self.hedge_tokens -= 1
+                return True
+            return False
+
+    async def create_batch(self, model: str, messages_list: list[Messages], concurrency: int = 5, **kwargs) -> BatchResponse:
+        return await create_batch(self.get_async_create_function(), model, messages_list, concurrency, **kwargs)
+
+    def iter_batch(self, model: str, messages_list: list[Messages], concurrency: int = 5, stats: BatchStats = None, **kwargs) -> AsyncIterator[BatchResult]:
+        return iter_batch(self.get_async_create_function(), model, messages_list, concurrency, stats, **kwargs)
+
     def get_create_function(self) -> callable:
         return self.create_completion
 
     def get_async_create_function(self) -> callable:
         return self.create_async_generator
 
-    def get_providers(self, stream: bool, ignored: list[str]) -> list[ProviderType]:
-        providers = [p for p in self.providers if (p.supports_stream or not stream) and p.__name__ not in ignored]
-        if self.shuffle:
+    def get_providers(self, stream: bool, ignored: list[str], model: str = None) -> list[ProviderType]:
+        if self.model_index is None:
+            providers = [p for p in self.providers if (p.supports_stream or not stream) and p.__name__ not in ignored]
+        else:
+            providers = self.model_index.get_providers(model, Capability.STREAM if stream else Capability.NONE)
+            if not providers and model:
+                providers = self.model_index.get_providers(None, Capability.STREAM if stream else Capability.NONE)
+            providers = [p for p in providers if p.__name__ not in ignored] if ignored else list(providers)
+        if self.circuit_breakers is not None:
+            providers = [p for p in providers if self.circuit_breakers.get(p).is_available()]
+        if self.scores is not None:
+            providers = self.scores.rank(providers, model, self.shuffle)
+        elif self.shuffle:
             random.shuffle(providers)
         return providers
 
+    def get_provider_kwargs(self, provider: ProviderType, kwargs: dict) -> dict:
+        # None passes kwargs through, False drops the ones a provider doesn't accept, True rejects them
+        if self.strict_parameters is None or not hasattr(provider, "filter_parameters"):
+            return kwargs
+        return provider.filter_parameters(kwargs, self.strict_parameters)
+
+    def get_continuation(self, provider: ProviderType, messages: Messages, kwargs: dict, splicer: Optional[ContinuationSplicer]) -> tuple[Messages, dict]:
+        kwargs = self.get_provider_kwargs(provider, kwargs)
+        if splicer is None:
+            return messages, kwargs
+        debug.log(f"{provider.__name__}: Resume after {len(splicer.partial)} characters")
+        messages = [*messages, {"role": "assistant", "content": splicer.partial}]
+        if hasattr(provider, "get_parameter_names") and "auto_continue" in provider.get_parameter_names():
+            kwargs = {**kwargs, "auto_continue": True}
+        return messages, kwargs
+
+    def has_timeouts(self) -> bool:
+        return self.first_token_timeout is not None or self.inter_chunk_timeout is not None
+
+    def apply_timeouts(self, provider: ProviderType, response):
+        if not self.has_timeouts():
+            return response
+        return iter_with_timeouts(provider.__name__, to_async_iterator(response), self.first_token_timeout, self.inter_chunk_timeout)
+
+    def get_rate_limit_delay(self, provider: ProviderType, tokens: int, wait: bool = True) -> Optional[float]:
+        delay = self.rate_limiters.get(provider).check(tokens, self.rate_limit_wait if wait else 0.0)
+        if delay is None:
+            debug.log(f"{provider.__name__}: Rate limited")
+        return delay
+
+    def acquire_rate_limit(self, provider: ProviderType, messages: Messages, wait: bool = True) -> bool:
+        if self.rate_limiters is None or self.rate_limiters.get(provider) is None:
+            return True
+        tokens = estimate_tokens(messages)
+        delay = self.get_rate_limit_delay(provider, tokens, wait)
+        if delay is None:
+            return False
+        if delay > 0:
+            time.sleep(delay)
+        return self.rate_limiters.get(provider).try_acquire(tokens)
+
+    async def acquire_rate_limit_async(self, provider: ProviderType, messages: Messages) -> bool:
+        if self.rate_limiters is None or self.rate_limiters.get(provider) is None:
+            return True
+        tokens = estimate_tokens(messages)
+        delay = self.get_rate_limit_delay(provider, tokens)
+        if delay is None:
+            return False
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self.rate_limiters.get(provider).try_acquire(tokens)
+
+    def acquire_provider(self, provider: ProviderType, messages: Messages, wait: bool = True) -> bool:
+        # The circuit breaker goes first, an open circuit must not consume rate limit tokens
+        if not self.allow_request(provider):
+            return False
+        if self.acquire_rate_limit(provider, messages, wait):
+            return True
+        self.release_request(provider)
+        return False
+
+    async def acquire_provider_async(self, provider: ProviderType, messages: Messages) -> bool:
+        if not self.allow_request(provider):
+            return False
+        if await self.acquire_rate_limit_async(provider, messages):
+            return True
+        self.release_request(provider)
+        return False
+
+    def release_request(self, provider: ProviderType) -> None:
+        if self.circuit_breakers is not None:
+            self.circuit_breakers.get(provider).release_probe()
+
+    def allow_request(self, provider: ProviderType) -> bool:
+        if self.circuit_breakers is None:
+            return True
+        if self.circuit_breakers.get(provider).allow_request():
+            return True
+        debug.log(f"{provider.__name__}: Circuit is open")
+        return False
+
+    def record_success(self, provider: ProviderType, model: str, stats: CallStats) -> None:
+        stats.finish()
+        metrics.record_call("router", provider.__name__, model, stats)
+        if self.scores is not None:
+            self.scores.record_success(provider.__name__, model, stats)
+        if self.circuit_breakers is not None:
+            self.circuit_breakers.get(provider).record_success()
+
+    def record_error(self, provider: ProviderType, model: str, stats: CallStats, error: Exception = None, failover: bool = True) -> None:
+        stats.finish()
+        metrics.record_call("router", provider.__name__, model, stats, "EmptyResponse" if error is None else error, failover)
+        if self.scores is not None:
+            self.scores.record_error(provider.__name__, model, stats)
+        if self.circuit_breakers is not None:
+            self.circuit_breakers.get(provider).record_failure()
+
 class RetryProvider(IterListProvider):
-    def __init__(self, providers: List[Type[BaseProvider]], shuffle: bool = True, single_provider_retry: bool = False,max_retries: int = 3,) -> None:
-        super().__init__(providers, shuffle)
+    def __init__(self, providers: List[Type[BaseProvider]], shuffle: bool = True, single_provider_retry: bool = False,max_retries: int = 3, retry_policy: RetryPolicy = None, **kwargs) -> None:
+        super().__init__(providers, shuffle, **kwargs)
         self.single_provider_retry = single_provider_retry
         self.max_retries = max_retries
+        self.retry_policy = RetryPolicy() if retry_policy is None else retry_policy
+
+    def get_retry_delay(self, attempt: int, error: Exception, started_at: float) -> Optional[float]:
+        if not self.retry_policy.is_retryable(error):
+            raise error
+
+        if attempt + 1 >= self.max_retries:
+            return None
+
+        delay = self.retry_policy.get_delay(attempt, error)
+        remaining = self.retry_policy.get_remaining(started_at)
+
+        if delay > self.retry_policy.max_delay:
+            debug.log(f"Retry delay of {delay:.2f}s exceeds the {self.retry_policy.max_delay:.2f}s maximum")
+            return None
 
+        if remaining is not None and delay >= remaining:
+            debug.log(f"Retry deadline exceeded: {delay:.2f}s delay, {remaining:.2f}s remaining")
+            return None
+
+        debug.log(f"Retry in {delay:.2f}s")
+        return delay
+
+    @tracing.traced
     def create_completion(self, model: str, messages: Messages, stream: bool = False, **kwargs,) -> CreateResult:
-        if self.single_provider_retry:
+        if self.single_provider_retry and self.has_timeouts():
+            yield from to_sync_generator(self.create_async_generator(model, messages, stream, **kwargs))
+        elif self.single_provider_retry:
             exceptions = {}
             started: bool = False
             provider = self.providers[0]
             self.last_provider = provider
+            started_at = time.monotonic()
             
             for attempt in range(self.max_retries):
+                if not self.acquire_provider(provider, messages):
+                    break
+                stats = CallStats()
                 try:
                     if debug.logging:
                         print(f"Using {provider.__name__} provider (attempt {attempt + 1})")
-                    response = provider.get_create_function()(model, messages, stream=stream, **kwargs)
+                    response = tracing.trace("provider", provider.get_create_function()(model, messages, stream=stream, **self.get_provider_kwargs(provider, kwargs)), provider=provider.__name__, model=model, attempt=attempt + 1)
                     for chunk in response:
                         if isinstance(chunk, str) or isinstance(chunk, ImageResponse):
+                            stats.add_chunk(chunk)
                             yield chunk
                             started = True
                     if started:
+                        self.record_success(provider, model, stats)
                         return
+                    self.record_error(provider, model, stats, failover=False)
                 except Exception as e:
+                    self.record_error(provider, model, stats, e, failover=False)
                     exceptions[provider.__name__] = e
                     if debug.logging:
                         print(f"{provider.__name__}: {e.__class__.__name__}: {e}")
                     if started:
                         raise e
+                    delay = self.get_retry_delay(attempt, e, started_at)
+                    if delay is None:
+                        break
+                    time.sleep(delay)
             raise_exceptions(exceptions)
         else:
             yield from super().create_completion(model, messages, stream, **kwargs)
 
+    @tracing.traced
     async def create_async_generator(self, model: str, messages: Messages, stream: bool = True, **kwargs) -> AsyncResult:
         exceptions = {}
         started = False
@@ -144,31 +465,141 @@ class RetryProvider(IterListProvider):
         if self.single_provider_retry:
             provider = self.providers[0]
             self.last_provider = provider
+            started_at = time.monotonic()
             for attempt in range(self.max_retries):
+                if not await self.acquire_provider_async(provider, messages):
+                    break
+                stats = CallStats()
                 try:
                     debug.log(f"Using {provider.__name__} provider (attempt {attempt + 1})")
-                    response = provider.get_async_create_function()(model, messages, stream=stream, **kwargs)
+                    response = self.apply_timeouts(provider, tracing.trace("provider", provider.get_async_create_function()(model, messages, stream=stream, **self.get_provider_kwargs(provider, kwargs)), provider=provider.__name__, model=model, attempt=attempt + 1))
                     if hasattr(response, "__aiter__"):
                         async for chunk in response:
                             if isinstance(chunk, str) or isinstance(chunk, ImageResponse):
+                                stats.add_chunk(chunk)
                                 yield chunk
                                 started = True
                     else:
                         response = await response
                         if response:
+                            stats.add_chunk(response)
                             yield response
                             started = True
                     if started:
+                        self.record_success(provider, model, stats)
                         return
+                    self.record_error(provider, model, stats, failover=False)
                 except Exception as e:
+                    self.record_error(provider, model, stats, e, failover=False)
                     exceptions[provider.__name__] = e
                     if debug.logging:
                         print(f"{provider.__name__}: {e.__class__.__name__}: {e}")
+                    if started:
+                        raise e
+                    delay = self.get_retry_delay(attempt, e, started_at)
+                    if delay is None:
+                        break
+                    await asyncio.sleep(delay)
             raise_exceptions(exceptions)
         else:
             async for chunk in super().create_async_generator(model, messages, stream, **kwargs):
                 yield chunk
                 
+async def iter_with_timeouts(name: str, response: AsyncIterator, first_token_timeout: float = None, inter_chunk_timeout: float = None) -> AsyncResult:
+    loop = asyncio.get_running_loop()
+    deadline = None if first_token_timeout is None else loop.time() + first_token_timeout
+    iterator = response.__aiter__()
+    started = False
+
+    try:
+        while True:
+            if started:
+                timeout = inter_chunk_timeout
+            else:
+                timeout = None if deadline is None else max(0, deadline - loop.time())
+            try:
+                chunk = await asyncio.wait_for(iterator.__anext__(), timeout)
+            except StopAsyncIteration:
+                return
+            except asyncio.TimeoutError:
+                if started:
+                    raise TimeoutError(f"{name}: No chunk within {inter_chunk_timeout}s")
+                raise TimeoutError(f"{name}: No first token within {first_token_timeout}s")
+            if chunk and (isinstance(chunk, str) or isinstance(chunk, ImageResponse)):
+                started = True
+            yield chunk
+    finally:
+        if hasattr(iterator, "aclose"):
+            await iterator.aclose()
+
+class ContinuationSplicer:
+    def __init__(self, partial: str, max_overlap: int = 256, min_overlap: int = 4) -> None:
+        self.partial = partial
+        self.tail = partial[-max_overlap:]
+        self.min_overlap = min_overlap
+        self.buffer = ""
+        self.spliced = False
+        self.received = 0
+
+    def feed(self, chunk: str) -> str:
+        self.received += 1
+        if self.spliced:
+            return chunk
+        self.buffer += chunk
+        # Wait while the output may still restart the answer or repeat its tail
+        if len(self.buffer) < len(self.partial) and self.partial.startswith(self.buffer):
+            return ""
+        if self.buffer in self.tail:
+            return ""
+        return self.splice()
+
+    def splice(self) -> str:
+        self.spliced = True
+        buffer, self.buffer = self.buffer, ""
+        if buffer.startswith(self.partial):
+            return buffer[len(self.partial):]
+        # The output ended while it was still repeating the start of the answer
+        if self.partial.startswith(buffer):
+            return ""
+        for size in range(min(len(buffer), len(self.tail)), self.min_overlap - 1, -1):
+            if self.tail.endswith(buffer[:size]):
+                return buffer[size:]
+        # Shorter overlaps are only trusted when they finish the word the answer was cut off in
+        if self.tail and not self.tail[-1].isspace():
+            word = self.tail.split()[-1]
+            if len(word) < self.min_overlap and buffer.startswith(word) and (len(buffer) == len(word) or buffer[len(word)].isalnum()):
+                return buffer[len(word):]
+        return buffer
+
+    def flush(self) -> str:
+        return "" if self.spliced else self.splice()
+
+    def iter_spliced(self, response: Iterator) -> Iterator:
+        for chunk in response:
+            if isinstance(chunk, str):
+                chunk = self.feed(chunk)
+            elif self.buffer:
+                # Text held back for the overlap check must come before e.g. a FinishReason
+                yield self.flush()
+            yield chunk
+        yield self.flush()
+
+    async def aiter_spliced(self, response: AsyncIterator) -> AsyncIterator:
+        async for chunk in response:
+            if isinstance(chunk, str):
+                chunk = self.feed(chunk)
+            elif self.buffer:
+                yield self.flush()
+            yield chunk
+        yield self.flush()
+
+def track_content(content: Optional[list[str]], chunk) -> Optional[list[str]]:
+    if content is None or isinstance(chunk, ImageResponse):
+        return None
+    if isinstance(chunk, str):
+        content.append(chunk)
+    return content
+
 def raise_exceptions(exceptions: dict) -> None:
     if exceptions:
         raise RetryProviderError("RetryProvider failed:\n" + "\n".join([
@@ -0,0 +1,174 @@
+# -----------------------------------------------------------------------------
+# Copyright [2025] [Krisna Pranav, Neura AI]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import time
+import random
+import threading
+from statistics import median
+from typing import Optional, Iterator
+
+from .types import ProviderType
+from .response import Usage
+from .. import metrics
+
+class CallStats:
+    def __init__(self) -> None:
+        self.started_at = time.monotonic()
+        self.first_chunk_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.chunks = 0
+        self.characters = 0
+        self.completion_tokens: Optional[int] = None
+
+    def add_chunk(self, chunk) -> None:
+        if isinstance(chunk, str):
+            if self.first_chunk_at is None:
+                self.first_chunk_at = time.monotonic()
+            self.chunks += 1
+            self.characters += len(chunk)
+        elif isinstance(chunk, Usage):
+            self.completion_tokens = getattr(chunk, "completion_tokens", self.completion_tokens)
+
+    def finish(self) -> None:
+        self.finished_at = time.monotonic()
+
+    @property
+    def time_to_first_token(self) -> Optional[float]:
+        return None if self.first_chunk_at is None else self.first_chunk_at - self.started_at
+
+    @property
+    def duration(self) -> float:
+        return (time.monotonic() if self.finished_at is None else self.finished_at) - self.started_at
+
+    @property
+    def tokens(self) -> int:
+        return self.characters // 4 if self.completion_tokens is None else self.completion_tokens
+
+    @property
+    def tokens_per_second(self) -> Optional[float]:
+        if self.first_chunk_at is None:
+            return None
+        generation = (time.monotonic() if self.finished_at is None else self.finished_at) - self.first_chunk_at
+        return self.tokens / generation if generation > 0 else None
+
+def iter_with_metrics(name: str, model: Optional[str], response: Iterator) -> Iterator:
+    stats = CallStats()
+    try:
+        for chunk in response:
+            stats.add_chunk(chunk)
+            yield chunk
+    except Exception as e:
+        stats.finish()
+        metrics.record_call("provider", name, model, stats, e)
+        raise
+    stats.finish()
+    metrics.record_call("provider", name, model, stats)
+
+class ProviderScore:
+    __slots__ = ("time_to_first_token", "tokens_per_second", "error_rate", "requests", "errors")
+
+    def __init__(self) -> None:
+        self.time_to_first_token: Optional[float] = None
+        self.tokens_per_second: Optional[float] = None
+        self.error_rate: float = 0.0
+        self.requests: int = 0
+        self.errors: int = 0
+
+    def get_dict(self) -> dict:
+        return {key: getattr(self, key) for key in self.__slots__}
+
+class ProviderScores:
+    def __init__(self, alpha: float = 0.3, exploration: float = 0.1, max_error_rate: float = 0.95, default_latency: float = 5.0, expected_tokens: int = 200, default_tokens_per_second: float = 50.0) -> None:
+        self.alpha = alpha
+        self.exploration = exploration
+        self.max_error_rate = max_error_rate
+        self.default_latency = default_latency
+        self.expected_tokens = expected_tokens
+        self.default_tokens_per_second = default_tokens_per_second
+        self.scores: dict[tuple[str, str], ProviderScore] = {}
+        self.lock = threading.Lock()
+
+    def _ewma(self, current: Optional[float], value: float) -> float:
+        return value if current is None else current + self.alpha * (value - current)
+
+    def _get(self, provider: str, model: str) -> ProviderScore:
+        key = (provider, model or "")
+        if key not in self.scores:
+            self.scores[key] = ProviderScore()
+        return self.scores[key]
+
+    def record_success(self, provider: str, model: str, stats: CallStats) -> None:
+        with self.lock:
+            score = self._get(provider, model)
+            score.requests += 1
+            score.error_rate = self._ewma(score.error_rate, 0.0)
+            if stats.time_to_first_token is not None:
+                score.time_to_first_token = self._ewma(score.time_to_first_token, stats.time_to_first_token)
+            if stats.tokens_per_second is not None:
+                score.tokens_per_second = self._ewma(score.tokens_per_second, stats.tokens_per_second)
+
+    def record_error(self, provider: str, model: str, stats: CallStats = None) -> None:
+        with self.lock:
+            score = self._get(provider, model)
+            score.requests += 1
+            score.errors += 1
+            score.error_rate = self._ewma(score.error_rate, 1.0)
+
+    def expected_latency(self, provider: str, model: str) -> Optional[float]:
+        score = self.scores.get((provider, model or ""))
+
+        if score is None or not score.requests:
+            return None
+
+        latency = self.default_latency if score.time_to_first_token is None else score.time_to_first_token
+        # Time to stream a typical answer, so fast starters with slow generation don't always win
+        latency += self.expected_tokens / (score.tokens_per_second or self.default_tokens_per_second)
+        return latency / (1 - min(score.error_rate, self.max_error_rate))
+
+    def rank(self, providers: list[ProviderType], model: str, shuffle: bool = True) -> list[ProviderType]:
+        latencies = {provider: self.expected_latency(provider.__name__, model) for provider in providers}
+        known = [latency for latency in latencies.values() if latency is not None]
+        # Providers without data get the median of the measured ones instead of jumping ahead of them
+        prior = median(known) if known else 0.0
+
+        providers = list(providers)
+        if shuffle:
+            # The sort is stable, so ties keep this random order
+            random.shuffle(providers)
+        providers.sort(key=lambda provider: prior if latencies[provider] is None else latencies[provider])
+
+        if len(providers) > 1 and random.random() < self.exploration:
+            providers.insert(0, providers.pop(random.randrange(1, len(providers))))
+
+        return providers
+
+    def get_scores(self) -> dict[str, dict[str, dict]]:
+        with self.lock:
+            result = {}
+            for (provider, model), score in self.scores.items():
+                result.setdefault(provider, {})[model] = {
+                    **score.get_dict(),
+                    "expected_latency": self.expected_latency(provider, model),
+                }
+            return result
+
+    def reset(self, provider: str = None, model: str = None) -> None:
+        with self.lock:
+            for key in list(self.scores):
+                if (provider is None or key[0] == provider) and (model is None or key[1] == model):
+                    del self.scores[key]
@@ -0,0 +1,128 @@
+# -----------------------------------------------------------------------------
+# Copyright [2025] [Krisna Pranav, Neura AI]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import asyncio
+from typing import Callable, Optional
+
+from ..typing import Messages, CreateResult, AsyncResult, AsyncIterator
+from .types import BaseProvider, ProviderType
+from .asyncio import to_sync_generator, to_async_iterator
+from .cache import get_request_key
+
+class Flight:
+    def __init__(self) -> None:
+        self.chunks: list = []
+        self.done: bool = False
+        self.error: Optional[BaseException] = None
+        self.subscribers: int = 0
+        self.event = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+
+    def notify(self) -> None:
+        event, self.event = self.event, asyncio.Event()
+        event.set()
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self.flights: dict[tuple, Flight] = {}
+
+    async def subscribe(self, key: str, create: Callable[[], AsyncIterator]) -> AsyncIterator:
+        flight_key = (asyncio.get_running_loop(), key)
+        flight = self.flights.get(flight_key)
+
+        if flight is None:
+            flight = Flight()
+            self.flights[flight_key] = flight
+            flight.task = asyncio.ensure_future(self._run(flight_key, flight, create))
+
+        flight.subscribers += 1
+        index = 0
+
+        try:
+            while True:
+                while index < len(flight.chunks):
+                    yield flight.chunks[index]
+                    index += 1
+                if flight.done:
+                    if flight.error is not None:
+                        raise flight.error
+                    return
+                await flight.event.wait()
+        finally:
+            flight.subscribers -= 1
+            if flight.subscribers == 0 and not flight.done:
+                self._remove(flight_key, flight)
+                flight.task.cancel()
+
+    async def _run(self, flight_key: tuple, flight: Flight, create: Callable[[], AsyncIterator]) -> None:
+        try:
+            async for chunk in to_async_iterator(create()):
+                flight.chunks.append(chunk)
+                flight.notify()
+        except asyncio.CancelledError as e:
+            flight.error = e
+        except Exception as e:
+            flight.error = e
+        finally:
+            flight.done = True
+            self._remove(flight_key, flight)
+            flight.notify()
+
+    def _remove(self, flight_key: tuple, flight: Flight) -> None:
+        if self.flights.get(flight_key) is flight:
+            del self.flights[flight_key]
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "flights": len(self.flights),
+            "subscribers": sum(flight.subscribers for flight in list(self.flights.values())),
+        }
+
+class SingleFlightProvider(BaseProvider):
+    def __init__(self, provider: ProviderType, single_flight: SingleFlight = None) -> None:
+        self.provider = provider
+        self.single_flight = SingleFlight() if single_flight is None else single_flight
+        self.__name__ = provider.__name__
+        self.url = provider.url
+        self.working = provider.working
+        self.supports_stream = provider.supports_stream
+        self.supports_message_history = provider.supports_message_history
+        self.supports_system_message = provider.supports_system_message
+
+    def create_completion(self, model: str, messages: Messages, stream: bool = False, **kwargs) -> CreateResult:
+        return to_sync_generator(self.create_async_generator(model, messages, stream=stream, **kwargs), stream=stream)
+
+    async def create_async_generator(self, model: str, messages: Messages, stream: bool = True, **kwargs) -> AsyncResult:
+        def create() -> AsyncIterator:
+            return self.provider.get_async_create_function()(model, messages, stream=stream, **kwargs)
+
+        key = get_request_key(self.provider.__name__, model, messages, stream=stream, **kwargs)
+
+        if key is None:
+            async for chunk in to_async_iterator(create()):
+                yield chunk
+            return
+
+        async for chunk in self.single_flight.subscribe(key, create):
+            yield chunk
+
+    def get_create_function(self) -> callable:
+        return self.create_completion
+
+    def get_async_create_function(self) -> callable:
+        return self.create_async_generator
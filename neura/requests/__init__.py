@@ -14,6 +14,8 @@
 # limitations under the License.
 # -----------------------------------------------------------------------------
 
+from __future__ import annotations
+
 import os
 import time
 import random
@@ -22,7 +24,6 @@ from urllib.parse import urlparse
 from typing import Iterator
 from http.cookies import Morsel
 from pathlib import Path
-from __future__ import annotations
 
 try:
     from curl_cffi.requests import Session, Response
@@ -55,8 +56,11 @@ try:
 except ImportError:
     has_platformdirs = False
 
-from .. import debug
+from .. import debug, tracing
 from .raise_for_status import raise_for_status
+from .pool import SessionPool, get_session, close_sessions, get_pool_stats
+from .dns import DNSCache, dns_cache, resolve
+from .warmup import warm_up, warm_up_periodically
 from ..errors import MissingRequirementsError
 from ..typing import Cookies
 from ..cookies import get_cookies_dir
@@ -104,47 +108,48 @@ def get_cookie_params_from_dict(cookies: Cookies, url: str = None, domain: str =
     }) for key, value in cookies.items()]
 
 async def get_args_from_nodriver(url: str, proxy: str = None, timeout: int = 120, wait_for: str = None, callback: callable = None, cookies: Cookies = None) -> dict:
-    browser, stop_browser = await get_nodriver(proxy=proxy, timeout=timeout)
+    with tracing.start_span("nodriver", host=urlparse(url).netloc):
+        browser, stop_browser = await get_nodriver(proxy=proxy, timeout=timeout)
     
-    try:
-        if debug.logging:
-            print(f"Open nodriver with url: {url}")
+        try:
+            if debug.logging:
+                print(f"Open nodriver with url: {url}")
             
-        domain = urlparse(url).netloc
+            domain = urlparse(url).netloc
         
-        if cookies is None:
-            cookies = {}
-        else:
-            await browser.cookies.set_all(get_cookie_params_from_dict(cookies, url=url, domain=domain))
+            if cookies is None:
+                cookies = {}
+            else:
+                await browser.cookies.set_all(get_cookie_params_from_dict(cookies, url=url, domain=domain))
             
-        page = await browser.get(url)
-        user_agent = await page.evaluate("window.navigator.userAgent")
-        await page.wait_for("body:not(.no-js)", timeout=timeout)
+            page = await browser.get(url)
+            user_agent = await page.evaluate("window.navigator.userAgent")
+            await page.wait_for("body:not(.no-js)", timeout=timeout)
         
-        if wait_for is not None:
-            await page.wait_for(wait_for, timeout=timeout)
+            if wait_for is not None:
+                await page.wait_for(wait_for, timeout=timeout)
             
-        if callback is not None:
-            await callback(page)
+            if callback is not None:
+                await callback(page)
             
-        for c in await page.send(nodriver.cdp.network.get_cookies([url])):
-            cookies[c.name] = c.value
+            for c in await page.send(nodriver.cdp.network.get_cookies([url])):
+                cookies[c.name] = c.value
             
-        await page.close()
+            await page.close()
         
-        return {
-            "impersonate": "chrome",
-            "cookies": cookies,
-            "headers": {
-                **DEFAULT_HEADERS,
-                "user-agent": user_agent,
-                "referer": url,
-            },
-            "proxy": proxy,
-        }
+            return {
+                "impersonate": "chrome",
+                "cookies": cookies,
+                "headers": {
+                    **DEFAULT_HEADERS,
+                    "user-agent": user_agent,
+                    "referer": url,
+                },
+                "proxy": proxy,
+            }
         
-    finally:
-        stop_browser()
+        finally:
+            stop_browser()
 
 def merge_cookies(cookies: Iterator[Morsel], response: Response) -> Cookies:
     if cookies is None:
@@ -15,10 +15,17 @@
 # -----------------------------------------------------------------------------
 
 from __future__ import annotations
-from aiohttp import ClientSession, ClientResponse, ClientTimeout, BaseConnector, FormData
+import time
+import socket
+from aiohttp import ClientSession, ClientResponse, ClientTimeout, BaseConnector, TCPConnector, FormData
+from aiohttp.abc import AbstractResolver
 from typing import AsyncIterator, Any, Optional
 from .defaults import DEFAULT_HEADERS
+from .dns import DNSCache, dns_cache
+from .events import ServerSentEvent, iter_events
+from .text import get_charset, iter_text
 from ..errors import MissingRequirementsError
+from .. import metrics, tracing
 
 class StreamResponse(ClientResponse):
     async def iter_lines(self) -> AsyncIterator[bytes]:
@@ -29,6 +36,12 @@ class StreamResponse(ClientResponse):
         async for chunk in self.content.iter_any():
             yield chunk
 
+    def iter_text(self, encoding: str = None, errors: str = "replace") -> AsyncIterator[str]:
+        return iter_text(self.iter_content(), encoding or get_charset(self.headers), errors)
+
+    def iter_events(self, format: str = "sse", decode_json: bool = False) -> AsyncIterator[ServerSentEvent]:
+        return iter_events(self.iter_content(), format, decode_json)
+
     async def json(self, content_type: str = None) -> Any:
         return await super().json(content_type=content_type)
 
@@ -53,15 +66,51 @@ class StreamSession(ClientSession):
             
         super().__init__(**kwargs, timeout=timeout, response_class=StreamResponse, connector=get_connector(connector, proxy), headers=headers)
 
-def get_connector(connector: BaseConnector = None, proxy: str = None, rdns: bool = False) -> Optional[BaseConnector]:
+    async def _request(self, method: str, str_or_url, **kwargs) -> ClientResponse:
+        if not metrics.is_enabled() and not tracing.is_enabled():
+            return await super()._request(method, str_or_url, **kwargs)
+
+        url = str(str_or_url)
+        started = time.monotonic()
+        with tracing.start_span("http", backend="aiohttp", method=method, url=url.split("?")[0]) as span:
+            try:
+                response = await super()._request(method, str_or_url, **kwargs)
+            except Exception as e:
+                metrics.record_http("aiohttp", method, url, e, time.monotonic() - started)
+                raise
+            metrics.record_http("aiohttp", method, url, response.status, time.monotonic() - started)
+            if span is not None:
+                span.set_attribute("status", response.status)
+            return response
+
+class CachedResolver(AbstractResolver):
+    def __init__(self, cache: DNSCache = None) -> None:
+        self.cache = dns_cache if cache is None else cache
+
+    async def resolve(self, host: str, port: int = 0, family: int = socket.AF_INET) -> list[dict]:
+        return [{
+            "hostname": host,
+            "host": address[0],
+            "port": address[1],
+            "family": family,
+            "proto": proto,
+            "flags": socket.AI_NUMERICHOST | socket.AI_NUMERICSERV,
+        } for family, _, proto, _, address in await self.cache.resolve(host, port, family)]
+
+    async def close(self) -> None:
+        pass
+
+def get_connector(connector: BaseConnector = None, proxy: str = None, rdns: bool = False, **kwargs) -> Optional[BaseConnector]:
     if proxy and not connector:
         try:
             from aiohttp_socks import ProxyConnector
             if proxy.startswith("socks5h://"):
                 proxy = proxy.replace("socks5h://", "socks5://")
                 rdns = True
-            connector = ProxyConnector.from_url(proxy, rdns=rdns)
+            connector = ProxyConnector.from_url(proxy, rdns=rdns, **kwargs)
         except ImportError:
             raise MissingRequirementsError('Install "aiohttp_socks" package for proxy support')
+    elif not connector:
+        connector = TCPConnector(resolver=CachedResolver(), **kwargs)
         
     return connector
\ No newline at end of file
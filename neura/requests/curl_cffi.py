@@ -14,13 +14,22 @@
 # limitations under the License.
 # -----------------------------------------------------------------------------
 
-import json
 from __future__ import annotations
+
+import json
+import time
+from curl_cffi import ffi, lib as curl_lib
 from curl_cffi.requests import AsyncSession, Response
+from curl_cffi.const import CurlOpt, CurlMOpt, CurlHttpVersion
 from typing import AsyncGenerator, Any
 from functools import partialmethod
+from urllib.parse import urlparse
+from .dns import dns_cache
+from .events import ServerSentEvent, iter_events
+from .text import get_charset, iter_text
+from .. import metrics, tracing
 try:
-    from curl_cffi.requests import CurlMime
+    from curl_cffi import CurlMime
     has_curl_mime = True
 except ImportError:
     has_curl_mime = False
@@ -31,8 +40,10 @@ except ImportError:
     has_curl_ws = False
     
 class StreamResponse:
-    def __init__(self, inner: Response) -> None:
+    def __init__(self, inner: Response, method: str = "GET", url: str = "") -> None:
         self.inner: Response = inner
+        self.method = method
+        self.url = url
 
     async def text(self) -> str:
         return await self.inner.atext()
@@ -49,8 +60,23 @@ class StreamResponse:
     def iter_content(self) -> AsyncGenerator[bytes, None]:
         return self.inner.aiter_content()
 
+    def iter_text(self, encoding: str = None, errors: str = "replace") -> AsyncGenerator[str, None]:
+        return iter_text(self.iter_content(), encoding or get_charset(self.inner.headers), errors)
+
+    def iter_events(self, format: str = "sse", decode_json: bool = False) -> AsyncGenerator[ServerSentEvent, None]:
+        return iter_events(self.iter_content(), format, decode_json)
+
     async def __aenter__(self):
-        inner: Response = await self.inner
+        started = time.monotonic()
+        with tracing.start_span("http", backend="curl_cffi", method=self.method, url=self.url.split("?")[0]) as span:
+            try:
+                inner: Response = await self.inner
+            except Exception as e:
+                metrics.record_http("curl_cffi", self.method, self.url, e, time.monotonic() - started)
+                raise
+            metrics.record_http("curl_cffi", self.method, self.url, inner.status_code, time.monotonic() - started)
+            if span is not None:
+                span.set_attribute("status", inner.status_code)
         
         self.inner = inner
         self.request = inner.request
@@ -65,12 +91,58 @@ class StreamResponse:
     async def __aexit__(self, *args):
         await self.inner.aclose()
 
+def set_multi_option(session: AsyncSession, option: CurlMOpt, value: int) -> None:
+    # AsyncCurl.setopt hands long options to libcurl as a pointer, which libcurl reads as the value
+    result = curl_lib.curl_multi_setopt(session.acurl._curlm, option, ffi.cast("void *", value))
+    if result != 0:
+        raise ValueError(f"Failed to set {option.name}: error {result}")
+
 class StreamSession(AsyncSession):
+    def __init__(self, *args, http2: bool = False, max_concurrent_streams: int = 100, max_host_connections: int = 6, **kwargs) -> None:
+        # The limits only apply to sessions that ask for HTTP/2. With PIPEWAIT, streams share one connection
+        # per host until it holds max_concurrent_streams. If ALPN falls back to HTTP/1.1, the connection cap
+        # bounds parallel requests per host, so a cap of 1 would serialize them, 6 matches what browsers allow.
+        if http2:
+            kwargs.setdefault("http_version", CurlHttpVersion.V2TLS)
+            # Session-wide handle budget, libcurl caps the streams of each connection itself
+            kwargs.setdefault("max_clients", max_concurrent_streams * max_host_connections)
+            # Wait for a connection that can be multiplexed instead of opening a new one
+            kwargs["curl_options"] = {CurlOpt.PIPEWAIT: 1, **(kwargs.get("curl_options") or {})}
+
+        super().__init__(*args, **kwargs)
+        self.http2 = http2
+        self.max_concurrent_streams = max_concurrent_streams
+        self.max_host_connections = max_host_connections
+        self.multiplexing = False
+        self.resolve: dict[tuple, str] = {}
+
+    def update_resolve(self, url: str) -> None:
+        # libcurl resolves hosts itself, hand it the addresses that warm_up() put into the DNS cache
+        parsed = urlparse(url)
+        if not parsed.hostname:
+            return
+        key = (parsed.hostname, parsed.port or (443 if parsed.scheme == "https" else 80))
+        entry = dns_cache.get_resolve_entry(*key)
+        if entry is not None and self.resolve.get(key) != entry:
+            self.resolve[key] = entry
+            self.curl_options = {**self.curl_options, CurlOpt.RESOLVE: list(self.resolve.values())}
+
+    def enable_multiplexing(self) -> None:
+        # libcurl multiplexes by default, only the connection and per-connection stream limits are set
+        set_multi_option(self, CurlMOpt.MAX_HOST_CONNECTIONS, self.max_host_connections)
+        set_multi_option(self, CurlMOpt.MAX_CONCURRENT_STREAMS, self.max_concurrent_streams)
+        self.multiplexing = True
+
     def request(self, method: str, url: str, ssl = None, **kwargs) -> StreamResponse:
-        if isinstance(kwargs.get("data"), CurlMime):
+        if has_curl_mime and isinstance(kwargs.get("data"), CurlMime):
             kwargs["multipart"] = kwargs.pop("data")
+
+        if self.http2 and not self.multiplexing:
+            self.enable_multiplexing()
+
+        self.update_resolve(url)
         
-        return StreamResponse(super().request(method, url, stream=True, verify=ssl, **kwargs))
+        return StreamResponse(super().request(method, url, stream=True, verify=ssl, **kwargs), method, url)
 
     def ws_connect(self, url, *args, **kwargs):
         return WebSocket(self, url, **kwargs)
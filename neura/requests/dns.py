@@ -0,0 +1,104 @@
+# -----------------------------------------------------------------------------
+# Copyright [2025] [Krisna Pranav, Neura AI]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import time
+import socket
+import asyncio
+import threading
+from asyncio import AbstractEventLoop
+from typing import Optional
+
+class DNSCache:
+    def __init__(self, ttl: float = 300, max_entries: int = 1024) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.entries: dict[tuple, tuple[float, list]] = {}
+        self.pending: dict[tuple, asyncio.Future] = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, host: str, port: int = 0, family: int = socket.AF_UNSPEC) -> list | None:
+        entry = self.entries.get((host, port, family))
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    def set(self, host: str, port: int, family: int, infos: list, ttl: float = None) -> None:
+        with self.lock:
+            self.entries.pop((host, port, family), None)
+            self.entries[(host, port, family)] = (time.monotonic() + (self.ttl if ttl is None else ttl), infos)
+            while len(self.entries) > self.max_entries:
+                del self.entries[next(iter(self.entries))]
+
+    async def resolve(self, host: str, port: int = 0, family: int = socket.AF_UNSPEC) -> list:
+        loop: AbstractEventLoop = asyncio.get_running_loop()
+        key = (host, port, family, loop)
+        while True:
+            infos = self.get(host, port, family)
+            if infos is not None:
+                self.hits += 1
+                return infos
+            pending = self.pending.get(key)
+            if pending is None:
+                break
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # Only the task that started the lookup was cancelled, take the lookup over
+                if not pending.cancelled():
+                    raise
+
+        self.misses += 1
+        future = self.pending[key] = loop.create_future()
+        try:
+            infos = await loop.getaddrinfo(host, port, family=family, type=socket.SOCK_STREAM)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Nobody may be waiting for the result, don't warn about it
+            future.exception()
+            raise
+        finally:
+            self.pending.pop(key, None)
+
+        self.set(host, port, family, infos)
+        future.set_result(infos)
+        return infos
+
+    def get_resolve_entry(self, host: str, port: int) -> Optional[str]:
+        infos = self.get(host, port)
+        if not infos:
+            return None
+        addresses = dict.fromkeys(f"[{info[4][0]}]" if info[0] == socket.AF_INET6 else info[4][0] for info in infos)
+        # The "+" prefix lets libcurl expire the entry after its DNS cache timeout
+        return f"+{host}:{port}:{','.join(addresses)}"
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+    def get_stats(self) -> dict:
+        return {"entries": len(self.entries), "hits": self.hits, "misses": self.misses}
+
+dns_cache = DNSCache()
+
+async def resolve(host: str, port: int = 0, family: int = socket.AF_UNSPEC) -> list:
+    return await dns_cache.resolve(host, port, family)
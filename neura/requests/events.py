@@ -0,0 +1,188 @@
+# -----------------------------------------------------------------------------
+# Copyright [2025] [Krisna Pranav, Neura AI]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import json
+from typing import AsyncIterator, Callable, Optional, Any
+
+try:
+    import orjson
+    has_orjson = True
+except ImportError:
+    has_orjson = False
+
+DONE = b"[DONE]"
+
+def get_json_decoder() -> Callable[[Any], Any]:
+    if has_orjson:
+        return orjson.loads
+    decoder = json.JSONDecoder()
+    scan_once, decode = decoder.scan_once, decoder.decode
+
+    def loads(data) -> Any:
+        text = str(data, "utf-8")
+        # Scan the value directly, decode() only adds whitespace handling and error reporting
+        try:
+            value, end = scan_once(text, 0)
+            if end == len(text):
+                return value
+        except StopIteration:
+            pass
+        return decode(text)
+
+    return loads
+
+class ServerSentEvent:
+    __slots__ = ("data", "event", "id", "retry")
+
+    def __init__(self, data: Any, event: str = "message", id: Optional[str] = None, retry: Optional[int] = None) -> None:
+        self.data = data
+        self.event = event
+        self.id = id
+        self.retry = retry
+
+    def __repr__(self) -> str:
+        return f"ServerSentEvent(event={self.event!r}, data={self.data!r}, id={self.id!r})"
+
+class EventParser:
+    def __init__(self, format: str = "sse", decode_json: bool = False, done: Optional[bytes] = DONE) -> None:
+        if format not in ("sse", "ndjson"):
+            raise ValueError(f"Unknown event format: {format}")
+        self.ndjson = format == "ndjson"
+        self.loads = get_json_decoder() if decode_json else None
+        self.done_marker = done
+        self.done = False
+        self.buffer = bytearray()
+        self.data: list = []
+        self.event: Optional[str] = None
+        self.id: Optional[str] = None
+        self.retry: Optional[int] = None
+
+    def feed(self, chunk: bytes) -> list[ServerSentEvent]:
+        buffer = self.buffer
+        buffer += chunk
+        events = []
+        start = 0
+        if self.ndjson or self.data:
+            start = self.feed_lines(events, start, not self.ndjson)
+        if not self.ndjson and not self.done:
+            # Complete events are split off in one go, the unfinished one stays in the buffer
+            end = buffer.rfind(b"\n\n", start)
+            if end >= 0:
+                for block in buffer[start:end].split(b"\n\n"):
+                    if self.done:
+                        break
+                    # Fast path for the single "data: ..." line nearly every event consists of
+                    if block.startswith(b"data: ") and b"\n" not in block and not block.endswith(b"\r"):
+                        self.emit(events, block[6:])
+                    else:
+                        self.feed_block(events, block)
+                start = end + 2
+            # Events that end with "\r\n\r\n" are parsed line by line
+            if not self.done and buffer.find(b"\r", start) >= 0:
+                start = self.feed_lines(events, start)
+        del buffer[:start]
+        return events
+
+    def feed_lines(self, events: list, start: int, until_dispatch: bool = False) -> int:
+        buffer, data = self.buffer, self.data
+        while not self.done:
+            end = buffer.find(b"\n", start)
+            if end < 0:
+                break
+            stop = end - 1 if end > start and buffer[end - 1] == 13 else end
+            line, start = buffer[start:stop], end + 1
+            if self.ndjson:
+                if line:
+                    data.append(line)
+                    self.dispatch(events)
+            elif self.parse_line(events, line) and until_dispatch:
+                break
+        return start
+
+    def feed_block(self, events: list, block: bytes) -> None:
+        for line in block.split(b"\n"):
+            self.parse_line(events, line[:-1] if line.endswith(b"\r") else line)
+        self.parse_line(events, b"")
+
+    def flush(self) -> list[ServerSentEvent]:
+        events = []
+        if self.buffer and not self.done:
+            self.buffer += b"\n"
+            self.feed_lines(events, 0)
+            self.buffer.clear()
+        if self.data and not self.done:
+            self.dispatch(events)
+        return events
+
+    def parse_line(self, events: list, line: bytes) -> bool:
+        if not line:
+            if self.data:
+                self.dispatch(events)
+                return True
+            self.event = None
+            return False
+        if line.startswith(b"data: "):
+            self.data.append(line[6:])
+            return False
+        if line[0] == 58:
+            return False
+
+        field, colon, value = line.partition(b":")
+        if colon and value.startswith(b" "):
+            value = value[1:]
+
+        if field == b"data":
+            self.data.append(value)
+        elif field == b"event":
+            self.event = str(value, "utf-8")
+        elif field == b"id":
+            self.id = str(value, "utf-8")
+        elif field == b"retry" and value.isdigit():
+            self.retry = int(value)
+        return False
+
+    def dispatch(self, events: list) -> None:
+        lines = self.data
+        data = lines[0] if len(lines) == 1 else b"\n".join(lines)
+        lines.clear()
+        self.emit(events, data)
+
+    def emit(self, events: list, data) -> None:
+        event, self.event = self.event, None
+        if data == self.done_marker:
+            self.done = True
+            return
+        if self.loads is not None:
+            try:
+                data = self.loads(data)
+            except ValueError:
+                # Keep the payload of a malformed event as text instead of failing the stream
+                data = str(data, "utf-8", "replace")
+        else:
+            data = str(data, "utf-8", "replace")
+        events.append(ServerSentEvent(data, event or "message", self.id, self.retry))
+
+async def iter_events(chunks: AsyncIterator[bytes], format: str = "sse", decode_json: bool = False) -> AsyncIterator[ServerSentEvent]:
+    parser = EventParser(format, decode_json)
+    async for chunk in chunks:
+        for event in parser.feed(chunk):
+            yield event
+        if parser.done:
+            return
+    for event in parser.flush():
+        yield event
@@ -0,0 +1,329 @@
+# -----------------------------------------------------------------------------
+# Copyright [2025] [Krisna Pranav, Neura AI]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import time
+import atexit
+import asyncio
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from asyncio import AbstractEventLoop
+from urllib.parse import urlparse
+from typing import AsyncIterator, Optional
+
+try:
+    from curl_cffi.const import CurlOpt, CurlMOpt
+    from .curl_cffi import StreamSession as CurlStreamSession, set_multi_option
+    has_curl_cffi = True
+except ImportError:
+    has_curl_cffi = False
+
+try:
+    from aiohttp import DummyCookieJar
+    from .aiohttp import StreamSession as AiohttpStreamSession, get_connector
+    has_aiohttp = True
+except ImportError:
+    has_aiohttp = False
+
+from .dns import dns_cache
+from .. import debug
+from ..errors import MissingRequirementsError
+
+class PooledSession:
+    __slots__ = ("key", "session", "loop", "leases", "last_used", "closing")
+
+    def __init__(self, key: tuple, session, loop: AbstractEventLoop) -> None:
+        self.key = key
+        self.session = session
+        self.loop = loop
+        self.leases: list[Optional[str]] = []
+        self.last_used = time.monotonic()
+        self.closing = False
+
+    @property
+    def in_use(self) -> int:
+        return len(self.leases)
+
+class SessionPool:
+    def __init__(self, max_sessions: int = 32, idle_timeout: float = 300, max_connections: int = 100, max_connections_per_host: int = 10) -> None:
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.sessions: OrderedDict[tuple, PooledSession] = OrderedDict()
+        self.watchers: dict[AbstractEventLoop, AsyncIterator] = {}
+        self.waiters: list[asyncio.Future] = []
+        self.active = 0
+        self.host_active: dict[str, int] = {}
+        self.lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+        self.evicted = 0
+
+    @asynccontextmanager
+    async def session(self, backend: str = None, impersonate: str = None, proxy: str = None, headers: dict = None, http2: bool = False, url: str = None) -> AsyncIterator:
+        host = urlparse(url).hostname if url else None
+        pooled = await self.acquire(backend, impersonate, proxy, headers, http2, host)
+        try:
+            yield pooled.session
+        finally:
+            await self.release(pooled, host)
+
+    async def acquire(self, backend: str = None, impersonate: str = None, proxy: str = None, headers: dict = None, http2: bool = False, host: str = None) -> PooledSession:
+        loop = asyncio.get_running_loop()
+        backend = get_backend(backend)
+        # Sessions are bound to the loop that created them, every loop gets one session per key
+        key = (backend, impersonate, proxy, tuple(sorted(headers.items())) if headers else (), http2, loop)
+        await self.watch(loop)
+
+        while True:
+            waiter = None
+            with self.lock:
+                evicted = self.pop_idle()
+                pooled = self.sessions.get(key)
+                # Leases are limited across all sessions, a lease stands for one request on one connection
+                if not self.has_slot(host):
+                    waiter = self.add_waiter(loop)
+                elif pooled is not None:
+                    self.sessions.move_to_end(key)
+                    self.reused += 1
+                elif len(self.sessions) < self.max_sessions or self.pop_oldest(evicted):
+                    pooled = self.sessions[key] = PooledSession(key, self.create_session(backend, impersonate, proxy, headers, http2), loop)
+                    self.created += 1
+                else:
+                    waiter = self.add_waiter(loop)
+                if waiter is None:
+                    self.take_slot(pooled, host)
+
+            await self.close_sessions(evicted)
+
+            if waiter is None:
+                return pooled
+
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self.lock:
+                    if waiter in self.waiters:
+                        self.waiters.remove(waiter)
+                raise
+
+    async def release(self, pooled: PooledSession, host: str = None) -> None:
+        with self.lock:
+            if host in pooled.leases:
+                self.give_slot(pooled, host)
+            pooled.last_used = time.monotonic()
+            closing = pooled.closing and not pooled.leases
+            if closing and self.sessions.get(pooled.key) is pooled:
+                del self.sessions[pooled.key]
+            evicted = self.pop_idle()
+            self.wake_waiters()
+
+        await self.close_sessions([pooled, *evicted] if closing else evicted)
+
+    async def watch(self, loop: AbstractEventLoop) -> None:
+        with self.lock:
+            if loop in self.watchers:
+                return
+            watcher = self.watchers[loop] = self.watch_loop(loop)
+        # The first step registers the generator with the loop, which closes it in shutdown_asyncgens()
+        await watcher.__anext__()
+
+    async def watch_loop(self, loop: AbstractEventLoop) -> AsyncIterator:
+        try:
+            yield
+        finally:
+            await self.close_loop(loop)
+
+    async def close_loop(self, loop: AbstractEventLoop) -> None:
+        with self.lock:
+            self.watchers.pop(loop, None)
+            sessions = [pooled for pooled in self.sessions.values() if pooled.loop is loop]
+            for pooled in sessions:
+                pooled.closing = True
+            # Sessions still in use are closed by their last release
+            idle = [pooled for pooled in sessions if not pooled.leases]
+            for pooled in idle:
+                del self.sessions[pooled.key]
+            self.wake_waiters()
+
+        await self.close_sessions(idle)
+
+    def create_session(self, backend: str, impersonate: str = None, proxy: str = None, headers: dict = None, http2: bool = False):
+        # Pooled sessions are shared by unrelated requests, so they never keep cookies
+        if backend == "curl_cffi":
+            if http2:
+                return CurlStreamSession(
+                    impersonate=impersonate,
+                    proxies={"all": proxy} if proxy else None,
+                    headers=headers,
+                    http2=True,
+                    discard_cookies=True,
+                    curl_options={CurlOpt.DNS_CACHE_TIMEOUT: int(dns_cache.ttl)}
+                )
+            session = CurlStreamSession(
+                impersonate=impersonate,
+                proxies={"all": proxy} if proxy else None,
+                headers=headers,
+                max_clients=self.max_connections,
+                discard_cookies=True,
+                curl_options={CurlOpt.DNS_CACHE_TIMEOUT: int(dns_cache.ttl)}
+            )
+            set_multi_option(session, CurlMOpt.MAX_TOTAL_CONNECTIONS, self.max_connections)
+            set_multi_option(session, CurlMOpt.MAX_HOST_CONNECTIONS, self.max_connections_per_host)
+            return session
+
+        return AiohttpStreamSession(
+            headers={} if headers is None else headers,
+            impersonate=impersonate,
+            cookie_jar=DummyCookieJar(),
+            connector=get_connector(proxy=proxy, limit=self.max_connections, limit_per_host=self.max_connections_per_host)
+        )
+
+    def has_slot(self, host: Optional[str]) -> bool:
+        if self.active >= self.max_connections:
+            return False
+        return host is None or self.host_active.get(host, 0) < self.max_connections_per_host
+
+    def take_slot(self, pooled: PooledSession, host: Optional[str]) -> None:
+        pooled.leases.append(host)
+        self.active += 1
+        if host is not None:
+            self.host_active[host] = self.host_active.get(host, 0) + 1
+
+    def give_slot(self, pooled: PooledSession, host: Optional[str]) -> None:
+        pooled.leases.remove(host)
+        self.active -= 1
+        if host is not None:
+            self.host_active[host] -= 1
+            if not self.host_active[host]:
+                del self.host_active[host]
+
+    def add_waiter(self, loop: AbstractEventLoop) -> asyncio.Future:
+        waiter = loop.create_future()
+        self.waiters.append(waiter)
+        return waiter
+
+    def wake_waiters(self) -> None:
+        waiters, self.waiters = self.waiters, []
+        for waiter in waiters:
+            try:
+                waiter.get_loop().call_soon_threadsafe(set_waiter_result, waiter)
+            except RuntimeError:
+                pass
+
+    def pop_idle(self) -> list[PooledSession]:
+        now = time.monotonic()
+        evicted = []
+        for pooled in list(self.sessions.values()):
+            if pooled.loop.is_closed():
+                # The loop was closed without shutting down its async generators, its leases never come back
+                while pooled.leases:
+                    self.give_slot(pooled, pooled.leases[-1])
+            elif pooled.leases or now - pooled.last_used <= self.idle_timeout or not pooled.loop.is_running():
+                continue
+            del self.sessions[pooled.key]
+            evicted.append(pooled)
+        for loop in [loop for loop in self.watchers if loop.is_closed()]:
+            del self.watchers[loop]
+        self.evicted += len(evicted)
+        if evicted:
+            self.wake_waiters()
+        return evicted
+
+    def pop_oldest(self, evicted: list[PooledSession]) -> bool:
+        for pooled in self.sessions.values():
+            # Sessions of a loop that isn't running can only be closed by that loop's shutdown
+            if not pooled.leases and pooled.loop.is_running():
+                del self.sessions[pooled.key]
+                evicted.append(pooled)
+                self.evicted += 1
+                return True
+        return False
+
+    async def close_sessions(self, sessions: list[PooledSession]) -> None:
+        loop = asyncio.get_running_loop()
+        for pooled in sessions:
+            try:
+                if pooled.loop is loop:
+                    await pooled.session.close()
+                elif pooled.loop.is_running():
+                    asyncio.run_coroutine_threadsafe(pooled.session.close(), pooled.loop)
+                else:
+                    debug.log("Dropping pooled session of a closed event loop")
+            except Exception as e:
+                debug.log(f"Failed to close pooled session: {e.__class__.__name__}: {e}")
+
+    async def close(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self.lock:
+            sessions = [pooled for pooled in self.sessions.values() if not pooled.leases and (pooled.loop is loop or pooled.loop.is_running())]
+            for pooled in sessions:
+                del self.sessions[pooled.key]
+        await self.close_sessions(sessions)
+
+    def discard(self, timeout: float = 5) -> None:
+        with self.lock:
+            sessions = list(self.sessions.values())
+            self.sessions.clear()
+        for pooled in sessions:
+            try:
+                if pooled.loop.is_running():
+                    asyncio.run_coroutine_threadsafe(pooled.session.close(), pooled.loop).result(timeout)
+                elif not pooled.loop.is_closed():
+                    pooled.loop.run_until_complete(pooled.session.close())
+            except Exception as e:
+                debug.log(f"Failed to close pooled session: {e.__class__.__name__}: {e}")
+
+    def get_stats(self) -> dict:
+        with self.lock:
+            return {
+                "sessions": len(self.sessions),
+                "in_use": self.active,
+                "waiting": len(self.waiters),
+                "created": self.created,
+                "reused": self.reused,
+                "evicted": self.evicted,
+            }
+
+def get_backend(backend: str = None) -> str:
+    if backend is None:
+        backend = "curl_cffi" if has_curl_cffi else "aiohttp"
+    if backend == "curl_cffi" and not has_curl_cffi:
+        raise MissingRequirementsError('Install "curl_cffi" package | pip install -U curl_cffi')
+    if backend == "aiohttp" and not has_aiohttp:
+        raise MissingRequirementsError('Install "aiohttp" package | pip install -U aiohttp')
+    if backend not in ("curl_cffi", "aiohttp"):
+        raise ValueError(f"Unknown session backend: {backend}")
+    return backend
+
+def set_waiter_result(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+session_pool = SessionPool()
+atexit.register(session_pool.discard)
+
+def get_session(backend: str = None, impersonate: str = None, proxy: str = None, headers: dict = None, http2: bool = False, url: str = None):
+    return session_pool.session(backend, impersonate, proxy, headers, http2, url)
+
+async def close_sessions() -> None:
+    await session_pool.close()
+
+def get_pool_stats() -> dict:
+    return session_pool.get_stats()
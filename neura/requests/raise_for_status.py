@@ -15,31 +15,118 @@
 # -----------------------------------------------------------------------------
 
 from __future__ import annotations
-from typing import Union
+import re
+import time
+from email.utils import parsedate_to_datetime
+from typing import Union, Optional
 from aiohttp import ClientResponse
 from requests import Response as RequestsResponse
 from ..errors import ResponseStatusError, RateLimitError
 from . import Response, StreamResponse
+from .text import get_charset
 
 class CloudflareError(ResponseStatusError):
     ...
 
+MAX_ERROR_BODY = 64 * 1024
+
+SIGNATURES = {
+    "cloudflare": [
+        "Generated by cloudfront",
+        '<p id="cf-spinner-please-wait">',
+        "<title>Attention Required! | Cloudflare</title>",
+        'id="cf-cloudflare-status"',
+        '<div id="cf-please-wait">',
+        "<title>Just a moment...</title>",
+    ],
+    "openai": [
+        "<p>Unable to load site</p>",
+        'id="challenge-error-text"',
+    ],
+}
+
+SIGNATURE_PATTERN = re.compile("|".join(
+    f"(?P<{name}>{'|'.join(re.escape(signature) for signature in signatures)})"
+    for name, signatures in SIGNATURES.items()
+))
+
+RATE_LIMIT_HEADERS = ["retry-after", "x-ratelimit-reset-requests", "x-ratelimit-reset-tokens", "x-ratelimit-reset", "ratelimit-reset"]
+
+def parse_duration(value: str) -> Optional[float]:
+    value = value.strip()
+
+    try:
+        seconds = float(value)
+        return seconds - time.time() if seconds > 1e9 else seconds
+    except ValueError:
+        pass
+
+    parts = re.findall(r"(\d+(?:\.\d+)?)(ms|h|m|s)", value)
+    if parts and "".join(number + unit for number, unit in parts) == value:
+        units = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+        return sum(float(number) * units[unit] for number, unit in parts)
+
+    try:
+        return parsedate_to_datetime(value).timestamp() - time.time()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+def get_retry_after(headers) -> Optional[float]:
+    if not headers:
+        return None
+
+    for name in RATE_LIMIT_HEADERS:
+        value = headers.get(name)
+        if value:
+            seconds = parse_duration(value)
+            if seconds is not None:
+                return max(0.0, seconds)
+
+    return None
+
+def classify(text: str) -> Optional[str]:
+    match = SIGNATURE_PATTERN.search(text, 0, MAX_ERROR_BODY)
+    return match.lastgroup if match else None
+
 def is_cloudflare(text: str) -> bool:
-    if "Generated by cloudfront" in text or '<p id="cf-spinner-please-wait">' in text:
-        return True
-    elif "<title>Attention Required! | Cloudflare</title>" in text or 'id="cf-cloudflare-status"' in text:
-        return True
-    
-    return '<div id="cf-please-wait">' in text or "<title>Just a moment...</title>" in text
+    return classify(text) == "cloudflare"
 
 def is_openai(text: str) -> bool:
-    return "<p>Unable to load site</p>" in text or 'id="challenge-error-text"' in text
+    return classify(text) == "openai"
+
+async def read_prefix(response: Union[StreamResponse, ClientResponse], limit: int = MAX_ERROR_BODY) -> str:
+    body = getattr(response, "_body", None)
+
+    if body is None:
+        chunks = response.iter_content() if hasattr(response, "iter_content") else response.content.iter_any()
+        buffer = bytearray()
+        async for chunk in chunks:
+            buffer += chunk
+            if len(buffer) >= limit:
+                break
+        body = bytes(buffer)
+
+    return body[:limit].decode(get_charset(response.headers), errors="replace")
+
+def get_error(status: int, message: str, text: str, retry_after: Optional[float]) -> ResponseStatusError:
+    classification = classify(text) if status == 403 else None
+
+    if classification == "cloudflare":
+        return CloudflareError(f"Response {status}: Cloudflare detected", status=status, retry_after=retry_after, classification=classification)
+    elif classification == "openai":
+        return ResponseStatusError(f"Response {status}: OpenAI Bot detected", status=status, retry_after=retry_after, classification=classification)
+    elif status == 502:
+        return ResponseStatusError(f"Response {status}: Bad gateway", status=status, retry_after=retry_after, classification="bad_gateway")
+    elif status == 429:
+        return RateLimitError(f"Response {status}: {message}", status=status, retry_after=retry_after, classification="rate_limit")
+
+    return ResponseStatusError(f"Response {status}: {message}", status=status, retry_after=retry_after, classification="http_error")
 
 async def raise_for_status_async(response: Union[StreamResponse, ClientResponse], message: str = None):
     if response.ok:
         return
     
-    text = await response.text()
+    text = await read_prefix(response)
     
     if message is None:
         is_html = response.headers.get("content-type", "").startswith("text/html") or text.startswith("<!DOCTYPE")
@@ -50,15 +137,8 @@ async def raise_for_status_async(response: Union[StreamResponse, ClientResponse]
             message = "Unknown error (Cloudflare)"
         elif response.status in (429, 402):
             message = "Rate limit"
-            
-    if response.status == 403 and is_cloudflare(text):
-        raise CloudflareError(f"Response {response.status}: Cloudflare detected")
-    elif response.status == 403 and is_openai(text):
-        raise ResponseStatusError(f"Response {response.status}: OpenAI Bot detected")
-    elif response.status == 502:
-        raise ResponseStatusError(f"Response {response.status}: Bad gateway")
-    else:
-        raise ResponseStatusError(f"Response {response.status}: {message}")
+
+    raise get_error(response.status, message, text, get_retry_after(response.headers))
 
 def raise_for_status(response: Union[Response, StreamResponse, ClientResponse, RequestsResponse], message: str = None):
     if hasattr(response, "status"):
@@ -67,22 +147,23 @@ def raise_for_status(response: Union[Response, StreamResponse, ClientResponse, R
     if response.ok:
         return
     
+    text = response.text[:MAX_ERROR_BODY]
+
     if message is None:
-        is_html = response.headers.get("content-type", "").startswith("text/html") or response.text.startswith("<!DOCTYPE")
-        message = "HTML content" if is_html else response.text
+        is_html = response.headers.get("content-type", "").startswith("text/html") or text.startswith("<!DOCTYPE")
+        message = "HTML content" if is_html else text
         
+    status = response.status_code
+    retry_after = get_retry_after(response.headers)
+
+    error = get_error(status, message, text, retry_after)
+
+    # The sync clients have always reported HTML error pages as rate limits, retry handling depends on it
     if message == "HTML content":
-        if response.status_code == 520:
+        if status == 520:
             message = "Unknown error (Cloudflare)"
-        elif response.status_code in (429, 402):
+        elif status in (429, 402):
             message = "Rate limit"
-        raise RateLimitError(f"Response {response.status_code}: {message}")
-    
-    if response.status_code == 403 and is_cloudflare(response.text):
-        raise CloudflareError(f"Response {response.status_code}: Cloudflare detected")
-    elif response.status_code == 403 and is_openai(response.text):
-        raise ResponseStatusError(f"Response {response.status_code}: OpenAI Bot detected")
-    elif response.status_code == 502:
-        raise ResponseStatusError(f"Response {response.status_code}: Bad gateway")
-    else:
-        raise ResponseStatusError(f"Response {response.status_code}: {message}")
\ No newline at end of file
+        raise RateLimitError(f"Response {status}: {message}", status=status, retry_after=retry_after, classification=error.classification)
+
+    raise error
@@ -0,0 +1,46 @@
+# -----------------------------------------------------------------------------
+# Copyright [2025] [Krisna Pranav, Neura AI]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import re
+import codecs
+from typing import AsyncIterator, Optional
+
+DEFAULT_CHARSET = "utf-8"
+
+CHARSET_PATTERN = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+
+def get_charset(headers, default: str = DEFAULT_CHARSET) -> str:
+    content_type: Optional[str] = headers.get("content-type") if headers is not None else None
+    if content_type:
+        match = CHARSET_PATTERN.search(content_type)
+        if match:
+            try:
+                return codecs.lookup(match.group(1)).name
+            except LookupError:
+                pass
+    return default
+
+async def iter_text(chunks: AsyncIterator[bytes], encoding: str = DEFAULT_CHARSET, errors: str = "replace") -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder(encoding)(errors)
+    async for chunk in chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    text = decoder.decode(b"", final=True)
+    if text:
+        yield text
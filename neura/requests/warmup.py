@@ -0,0 +1,82 @@
+# -----------------------------------------------------------------------------
+# Copyright [2025] [Krisna Pranav, Neura AI]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import sys
+import time
+import asyncio
+from urllib.parse import urlparse
+
+from ..providers.types import BaseProvider, ProviderType
+from .dns import dns_cache
+from .. import debug
+
+HOST_ATTRIBUTES = ["url", "api_endpoint", "DOMAINS"]
+
+def get_registered_providers() -> list[ProviderType]:
+    providers, pending = [], list(BaseProvider.__subclasses__())
+    while pending:
+        provider = pending.pop()
+        pending.extend(provider.__subclasses__())
+        if getattr(provider, "working", False) and provider not in providers:
+            providers.append(provider)
+    return providers
+
+def get_provider_origins(provider: ProviderType) -> list[str]:
+    module = sys.modules.get(provider.__module__)
+    origins = []
+    for name in HOST_ATTRIBUTES:
+        value = getattr(provider, name, getattr(module, name, None))
+        for url in [value] if isinstance(value, str) else value or []:
+            parsed = urlparse(url)
+            if parsed.scheme in ("http", "https") and parsed.netloc:
+                origin = f"{parsed.scheme}://{parsed.netloc}"
+                if origin not in origins:
+                    origins.append(origin)
+    return origins
+
+async def warm_up_origin(origin: str, timeout: float = 10) -> dict:
+    parsed = urlparse(origin)
+    started = time.monotonic()
+    result = {"resolved": 0, "error": None}
+    try:
+        infos = await asyncio.wait_for(dns_cache.resolve(parsed.hostname, parsed.port or (443 if parsed.scheme == "https" else 80)), timeout)
+        result["resolved"] = len(infos)
+    except Exception as e:
+        result["error"] = f"{e.__class__.__name__}: {e}"
+        debug.log(f"Warm up of {origin} failed: {result['error']}")
+    result["duration"] = time.monotonic() - started
+    return result
+
+async def warm_up(providers: list[ProviderType] = None, timeout: float = 10, concurrency: int = 16) -> dict[str, dict]:
+    origins = []
+    for provider in get_registered_providers() if providers is None else providers:
+        origins.extend(origin for origin in get_provider_origins(provider) if origin not in origins)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(origin: str) -> dict:
+        async with semaphore:
+            return await warm_up_origin(origin, timeout)
+
+    return dict(zip(origins, await asyncio.gather(*[run(origin) for origin in origins])))
+
+async def warm_up_periodically(interval: float = None, **kwargs) -> None:
+    interval = dns_cache.ttl * 0.8 if interval is None else interval
+    while True:
+        await warm_up(**kwargs)
+        await asyncio.sleep(interval)
@@ -0,0 +1,240 @@
+# -----------------------------------------------------------------------------
+# Copyright [2025] [Krisna Pranav, Neura AI]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import os
+import json
+import time
+import atexit
+import threading
+from queue import SimpleQueue, Empty
+from collections import deque
+from contextlib import nullcontext
+from contextvars import ContextVar
+from functools import wraps
+from pathlib import Path
+from typing import Optional, Iterator, AsyncIterator, Callable, Union
+
+from . import debug
+
+current_span: ContextVar[Optional[Span]] = ContextVar("neura_current_span", default=None)
+
+class TracingConfig:
+    enabled: bool = False
+    exporters: list = []
+
+class Span:
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "attributes", "start_time", "started_at", "finished_at", "error", "token")
+
+    def __init__(self, name: str, parent: Optional[Span] = None, attributes: dict = None) -> None:
+        self.name = name
+        self.trace_id = os.urandom(16).hex() if parent is None else parent.trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = None if parent is None else parent.span_id
+        self.attributes = {} if attributes is None else attributes
+        self.start_time = time.time()
+        self.started_at = time.monotonic()
+        self.finished_at: Optional[float] = None
+        self.error: Optional[str] = None
+        self.token = None
+
+    def set_attribute(self, key: str, value) -> None:
+        self.attributes[key] = value
+
+    def set_error(self, error: BaseException) -> None:
+        self.error = f"{error.__class__.__name__}: {error}"
+
+    def finish(self) -> None:
+        if self.finished_at is not None:
+            return
+        self.finished_at = time.monotonic()
+        for exporter in TracingConfig.exporters:
+            try:
+                exporter.export(self)
+            except Exception as e:
+                debug.log(f"Failed to export span {self.name}: {e.__class__.__name__}: {e}")
+
+    @property
+    def duration(self) -> float:
+        return (time.monotonic() if self.finished_at is None else self.finished_at) - self.started_at
+
+    def get_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "duration": self.duration,
+            "status": "ok" if self.error is None else "error",
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+    def __enter__(self) -> Span:
+        self.token = current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_value is not None:
+            self.set_error(exc_value)
+        reset_span(self.token)
+        self.finish()
+
+class RingBufferExporter:
+    def __init__(self, max_spans: int = 1000) -> None:
+        self.spans: deque[Span] = deque(maxlen=max_spans)
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def get_spans(self, trace_id: str = None) -> list[dict]:
+        return [span.get_dict() for span in list(self.spans) if trace_id is None or span.trace_id == trace_id]
+
+    def clear(self) -> None:
+        self.spans.clear()
+
+class JsonLinesExporter:
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self.queue: SimpleQueue = SimpleQueue()
+        self.lock = threading.Lock()
+        self.thread: Optional[threading.Thread] = None
+        atexit.register(self.close)
+
+    def export(self, span: Span) -> None:
+        # Spans finish on the event loop, so the file is written from a background thread
+        self.queue.put(span.get_dict())
+        if self.thread is None:
+            with self.lock:
+                if self.thread is None:
+                    self.thread = threading.Thread(target=self.write_spans, name="neura-trace-writer", daemon=True)
+                    self.thread.start()
+
+    def write_spans(self) -> None:
+        try:
+            with self.path.open("a", encoding="utf-8") as file:
+                while True:
+                    spans = [self.queue.get()]
+                    try:
+                        while spans[-1] is not None:
+                            spans.append(self.queue.get_nowait())
+                    except Empty:
+                        pass
+                    file.write("".join(json.dumps(span, default=str) + "\n" for span in spans if span is not None))
+                    file.flush()
+                    if spans[-1] is None:
+                        return
+        except OSError as e:
+            debug.log(f"Failed to write spans to {self.path}: {e.__class__.__name__}: {e}")
+            with self.lock:
+                self.thread = None
+
+    def close(self) -> None:
+        with self.lock:
+            thread, self.thread = self.thread, None
+        if thread is not None:
+            self.queue.put(None)
+            thread.join()
+
+def enable_tracing(enabled: bool = True) -> None:
+    TracingConfig.enabled = enabled
+
+def is_enabled() -> bool:
+    return TracingConfig.enabled
+
+def add_exporter(exporter) -> None:
+    TracingConfig.exporters.append(exporter)
+    TracingConfig.enabled = True
+
+def remove_exporter(exporter) -> None:
+    if exporter in TracingConfig.exporters:
+        TracingConfig.exporters.remove(exporter)
+
+def get_current_span() -> Optional[Span]:
+    return current_span.get()
+
+def reset_span(token) -> None:
+    try:
+        current_span.reset(token)
+    except ValueError:
+        # Generators can be closed from another context, e.g. by the loop's asyncgen finalizer
+        current_span.set(None)
+
+def start_span(name: str, **attributes):
+    if not TracingConfig.enabled:
+        return nullcontext()
+    return Span(name, current_span.get(), attributes)
+
+def trace(name: str, iterator: Union[Iterator, AsyncIterator], **attributes) -> Union[Iterator, AsyncIterator]:
+    if not TracingConfig.enabled:
+        return iterator
+    if hasattr(iterator, "__aiter__"):
+        return trace_async_generator(name, iterator, attributes)
+    if hasattr(iterator, "__iter__"):
+        return trace_generator(name, iterator, attributes)
+    return iterator
+
+def trace_generator(name: str, iterator: Iterator, attributes: dict) -> Iterator:
+    span = Span(name, current_span.get(), attributes)
+    iterator = iter(iterator)
+    try:
+        while True:
+            token = current_span.set(span)
+            try:
+                chunk = next(iterator)
+            except StopIteration:
+                break
+            finally:
+                reset_span(token)
+            yield chunk
+    except Exception as e:
+        span.set_error(e)
+        raise
+    finally:
+        if hasattr(iterator, "close"):
+            iterator.close()
+        span.finish()
+
+async def trace_async_generator(name: str, iterator: AsyncIterator, attributes: dict) -> AsyncIterator:
+    span = Span(name, current_span.get(), attributes)
+    iterator = iterator.__aiter__()
+    try:
+        while True:
+            token = current_span.set(span)
+            try:
+                chunk = await iterator.__anext__()
+            except StopAsyncIteration:
+                break
+            finally:
+                reset_span(token)
+            yield chunk
+    except Exception as e:
+        span.set_error(e)
+        raise
+    finally:
+        if hasattr(iterator, "aclose"):
+            await iterator.aclose()
+        span.finish()
+
+def traced(func: Callable) -> Callable:
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not TracingConfig.enabled:
+            return func(*args, **kwargs)
+        return trace(func.__qualname__, func(*args, **kwargs))
+    return wrapper
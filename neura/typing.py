@@ -29,7 +29,7 @@ if sys.version_info >= (3, 8):
 else:
     from typing_extensions import TypedDict
     
-from providers.response import ResponseType
+from .providers.response import ResponseType
 
 
 SHA256 = NewType('sha_256_hash', str)
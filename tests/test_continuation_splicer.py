@@ -0,0 +1,46 @@
+# -----------------------------------------------------------------------------
+# Copyright [2025] [Krisna Pranav, Neura AI]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import unittest
+
+from neura.providers.retry_provider import ContinuationSplicer
+
+def splice(partial: str, chunks: list[str]) -> str:
+    splicer = ContinuationSplicer(partial)
+    return partial + "".join(splicer.iter_spliced(iter(chunks)))
+
+class TestContinuationSplicer(unittest.TestCase):
+    def test_prefix_of_partial_is_held_back(self):
+        self.assertEqual(splice("Hello wor", ["Hel"]), "Hello wor")
+        self.assertEqual(splice("Hello wor", ["He", "llo"]), "Hello wor")
+
+    def test_restart_is_spliced(self):
+        self.assertEqual(splice("Hello wor", ["Hello ", "world!"]), "Hello world!")
+
+    def test_short_overlap_at_word_boundary(self):
+        self.assertEqual(splice("Hello wor", ["world!"]), "Hello world!")
+        self.assertEqual(splice("Hello wor", ["wo", "rld!"]), "Hello world!")
+
+    def test_long_overlap(self):
+        self.assertEqual(splice("The quick brown fox", ["brown fox jumps"]), "The quick brown fox jumps")
+
+    def test_unrelated_continuation(self):
+        self.assertEqual(splice("Hello wor", [" and more"]), "Hello wor and more")
+
+if __name__ == "__main__":
+    unittest.main()